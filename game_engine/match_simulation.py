@@ -3,7 +3,7 @@ Advanced volleyball match simulation engine
 """
 
 import random
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
@@ -18,14 +18,44 @@ class MatchEvent(Enum):
     DIG_SAVE = "dig_save"
 
 
-@dataclass
-class RallyResult:
-    winner: str
-    events: List[Dict]
-    duration: float
-
-
-@dataclass
+# Event types as plain strings for the rally loop, which would otherwise go
+# through Enum attribute lookups for every event
+SERVE_ACE = MatchEvent.SERVE_ACE.value
+SERVE_ERROR = MatchEvent.SERVE_ERROR.value
+ATTACK_KILL = MatchEvent.ATTACK_KILL.value
+ATTACK_ERROR = MatchEvent.ATTACK_ERROR.value
+BLOCK_POINT = MatchEvent.BLOCK_POINT.value
+DIG_SAVE = MatchEvent.DIG_SAVE.value
+
+# Sides as ints inside the rally loop, so the other side is ``team ^ 1``;
+# TEAM_NAMES turns them back into the "home"/"away" used in results
+HOME = 0
+AWAY = 1
+TEAM_NAMES = ("home", "away")
+
+# Match stat counted for each event type; digs are not counted
+MATCH_STAT_BY_EVENT = {
+    ATTACK_KILL: "kills",
+    BLOCK_POINT: "blocks",
+    SERVE_ACE: "aces",
+    SERVE_ERROR: "errors",
+    ATTACK_ERROR: "errors",
+}
+
+# (attack, defense) multipliers for each formation; unknown formations get none
+FORMATION_BONUSES = {
+    "6-2": (1.1, 0.95),
+    "5-1": (1.0, 1.0),
+    "4-2": (0.9, 1.05),
+}
+DEFAULT_FORMATION_BONUS = (1.0, 1.0)
+
+# Momentum for each home lead, 0.1 per point and saturating at +/-1.0 from a
+# ten-point lead, so the set loop updates it with a lookup
+MOMENTUM_BY_LEAD = {lead: lead * 0.1 for lead in range(-10, 11)}
+
+
+@dataclass(slots=True)
 class SetResult:
     home_points: int
     away_points: int
@@ -34,16 +64,37 @@ class SetResult:
     events: List[Dict]
 
 
+@dataclass(slots=True)
+class Team:
+    id: str
+    club: Dict
+    players: List[Dict]
+
+
 class VolleyballSimulator:
     """Advanced volleyball match simulation engine"""
 
+    # Player document fields read during simulation (team strength)
+    PLAYER_FIELDS = [
+        "attributes.spikePower",
+        "attributes.spikeAccuracy",
+        "attributes.blockTiming",
+        "attributes.passingAccuracy",
+        "attributes.servePower",
+        "attributes.serveAccuracy",
+    ]
+
     def __init__(self):
         self.HOME_ADVANTAGE = 1.05
         self.FATIGUE_IMPACT = 0.02
         self.MOMENTUM_FACTOR = 0.0
+        # Fatigue (0-100) each side has built up during the current match
+        self.fatigue = {"home": 0.0, "away": 0.0}
 
-    def simulate_match(self, home_team: Dict, away_team: Dict, tactics: Dict) -> Dict:
+    def simulate_match(self, home_team: Team, away_team: Team, tactics: Dict) -> Dict:
         """Simulate complete volleyball match"""
+        self.MOMENTUM_FACTOR = 0.0
+        self.fatigue = {"home": 0.0, "away": 0.0}
 
         home_strength = self._calculate_team_strength(home_team, tactics["home"])
         away_strength = self._calculate_team_strength(away_team, tactics["away"])
@@ -79,14 +130,14 @@ class VolleyballSimulator:
 
             total_rallies += len(set_result.events)
 
-            self._apply_fatigue(home_team, away_team, set_result.duration)
+            self._apply_fatigue(set_result.duration)
 
         attendance = self._calculate_attendance(home_team, away_team)
         revenue = self._calculate_revenue(home_team, attendance)
 
         return {
-            "homeClubId": home_team["id"],
-            "awayClubId": away_team["id"],
+            "homeClubId": home_team.id,
+            "awayClubId": away_team.id,
             "date": datetime.now().isoformat(),
             "result": {
                 "homeSets": home_sets,
@@ -102,9 +153,9 @@ class VolleyballSimulator:
             "tactics": tactics,
         }
 
-    def _calculate_team_strength(self, team: Dict, tactics: Dict) -> Dict:
+    def _calculate_team_strength(self, team: Team, tactics: Dict) -> Dict:
         """Calculate overall team strength based on players and tactics"""
-        players = team.get("players", [])
+        players = team.players
         if not players:
             return {
                 "overall": 50.0,
@@ -114,47 +165,37 @@ class VolleyballSimulator:
                 "receive": 50.0,
             }
 
-        total_attack = sum(
-            p.get("attributes", {}).get("spikePower", 50)
-            + p.get("attributes", {}).get("spikeAccuracy", 50)
-            for p in players
-        ) / (2 * len(players))
-        total_defense = sum(
-            p.get("attributes", {}).get("blockTiming", 50)
-            + p.get("attributes", {}).get("passingAccuracy", 50)
-            for p in players
-        ) / (2 * len(players))
-        total_serve = sum(
-            p.get("attributes", {}).get("servePower", 50)
-            + p.get("attributes", {}).get("serveAccuracy", 50)
-            for p in players
-        ) / (2 * len(players))
-        total_receive = sum(
-            p.get("attributes", {}).get("passingAccuracy", 50) for p in players
-        ) / len(players)
-
-        formation_bonus = self._get_formation_bonus(tactics.get("formation", "5-1"))
+        # One pass over the roster; passingAccuracy feeds defense and receive
+        attack_sum = defense_sum = serve_sum = receive_sum = 0
+        for p in players:
+            attrs = p.get("attributes", {})
+            passing = attrs.get("passingAccuracy", 50)
+            attack_sum += attrs.get("spikePower", 50) + attrs.get("spikeAccuracy", 50)
+            defense_sum += attrs.get("blockTiming", 50) + passing
+            serve_sum += attrs.get("servePower", 50) + attrs.get("serveAccuracy", 50)
+            receive_sum += passing
+
+        player_count = len(players)
+        total_attack = attack_sum / (2 * player_count)
+        total_defense = defense_sum / (2 * player_count)
+        total_serve = serve_sum / (2 * player_count)
+        total_receive = receive_sum / player_count
+
+        attack_bonus, defense_bonus = FORMATION_BONUSES.get(
+            tactics.get("formation", "5-1"), DEFAULT_FORMATION_BONUS
+        )
         intensity = tactics.get("intensity", 1.0)
 
         return {
             "overall": (total_attack + total_defense + total_serve + total_receive)
             / 4
             * intensity,
-            "attack": total_attack * formation_bonus.get("attack", 1.0) * intensity,
-            "defense": total_defense * formation_bonus.get("defense", 1.0) * intensity,
+            "attack": total_attack * attack_bonus * intensity,
+            "defense": total_defense * defense_bonus * intensity,
             "serve": total_serve * intensity,
             "receive": total_receive * intensity,
         }
 
-    def _get_formation_bonus(self, formation: str) -> Dict[str, float]:
-        """Get tactical bonuses for different formations"""
-        bonuses = {
-            "6-2": {"attack": 1.1, "defense": 0.95},
-            "5-1": {"attack": 1.0, "defense": 1.0},
-            "4-2": {"attack": 0.9, "defense": 1.05},
-        }
-        return bonuses.get(formation, {"attack": 1.0, "defense": 1.0})
-
     def _simulate_set(
         self, home_strength: Dict, away_strength: Dict, is_fifth_set: bool
     ) -> SetResult:
@@ -162,25 +203,40 @@ class VolleyballSimulator:
         target_points = 15 if is_fifth_set else 25
         home_points = 0
         away_points = 0
-        events = []
-
-        serving_team = random.choice(["home", "away"])
+        events: List[Dict[str, Any]] = []
+
+        serving_team = random.randrange(2)
+        home_strength = self._fatigued_strength(home_strength, "home")
+        away_strength = self._fatigued_strength(away_strength, "away")
+        # Indexed by HOME / AWAY
+        serve_odds = (
+            self._serve_odds(home_strength, away_strength, HOME),
+            self._serve_odds(away_strength, home_strength, AWAY),
+        )
+        attack_profiles = (
+            self._attack_profile(home_strength, away_strength, HOME),
+            self._attack_profile(away_strength, home_strength, AWAY),
+        )
 
-        while not self._is_set_complete(home_points, away_points, target_points):
-            rally_result = self._simulate_rally(
-                home_strength, away_strength, serving_team
+        # A set ends right after a point, and only the side that won it can
+        # have closed it out, so just that side is checked against the target
+        set_complete = False
+        while not set_complete:
+            winner = self._simulate_rally(
+                serving_team, serve_odds[serving_team], attack_profiles, events
             )
 
-            events.extend(rally_result.events)
-
-            if rally_result.winner == "home":
+            if winner == HOME:
                 home_points += 1
-                serving_team = "home"
+                lead = home_points - away_points
+                set_complete = home_points >= target_points and lead >= 2
             else:
                 away_points += 1
-                serving_team = "away"
+                lead = home_points - away_points
+                set_complete = away_points >= target_points and lead <= -2
+            serving_team = winner
 
-            self._update_momentum(home_points, away_points)
+            self.MOMENTUM_FACTOR = MOMENTUM_BY_LEAD.get(lead, 1.0 if lead > 0 else -1.0)
 
         return SetResult(
             home_points=home_points,
@@ -190,202 +246,158 @@ class VolleyballSimulator:
             events=events,
         )
 
-    def _is_set_complete(
-        self, home_points: int, away_points: int, target_points: int
-    ) -> bool:
-        """Check if set is complete"""
-        if home_points >= target_points and home_points - away_points >= 2:
-            return True
-        if away_points >= target_points and away_points - home_points >= 2:
-            return True
-        return False
-
     def _simulate_rally(
-        self, home_strength: Dict, away_strength: Dict, serving_team: str
-    ) -> RallyResult:
-        """Simulate individual rally with realistic volleyball mechanics"""
-
-        events = []
-        rally_active = True
-        touches = 0
-
-        if serving_team == "home":
-            serve_str = home_strength
-            receive_str = away_strength
-        else:
-            serve_str = away_strength
-            receive_str = home_strength
-
-        serve_outcome = self._simulate_serve(serve_str, receive_str, serving_team)
-        events.append(serve_outcome["event"])
-
-        if serve_outcome["rally_ends"]:
-            return RallyResult(
-                winner=serve_outcome["winner"],
-                events=events,
-                duration=random.uniform(2, 5),
-            )
-
-        attacking_team = "away" if serving_team == "home" else "home"
-
-        while (
-            rally_active and touches < 20
-        ):  # Max 20 touches to prevent infinite rallies
-            if attacking_team == "home":
-                attack_str = home_strength
-                defense_str = away_strength
-            else:
-                attack_str = away_strength
-                defense_str = home_strength
+        self,
+        serving_team: int,
+        serve_odds: Tuple[float, float, Dict, Dict, Dict],
+        attack_profiles: Tuple[Tuple[float, float, Dict, Dict, Dict, Dict], ...],
+        events: List[Dict],
+    ) -> int:
+        """Simulate individual rally with realistic volleyball mechanics
+
+        Serve and attack phases are inlined and read the per-set odds and
+        profiles, so a rally makes no further calls or strength lookups. The
+        rally's events are appended straight to the set's event list and the
+        winning side (HOME or AWAY) is returned.
+        """
+        ace_prob, ace_or_error_prob, ace_event, serve_error_event, reception_event = (
+            serve_odds
+        )
+        receiving_team = serving_team ^ 1
 
-            attack_outcome = self._simulate_attack(
-                attack_str, defense_str, attacking_team
+        # Serve phase
+        outcome = random.random()
+        if outcome < ace_prob:
+            events.append(ace_event)
+            return serving_team
+        if outcome < ace_or_error_prob:
+            events.append(serve_error_event)
+            return receiving_team
+        events.append(reception_event)
+
+        # Momentum only changes between rallies
+        home_momentum_bonus = self.MOMENTUM_FACTOR * 0.1
+        attacking_team = receiving_team
+
+        for _ in range(20):  # Max 20 touches to prevent infinite rallies
+            (
+                attack_power,
+                defense_power,
+                kill_event,
+                dig_event,
+                block_event,
+                attack_error_event,
+            ) = attack_profiles[attacking_team]
+            defending_team = attacking_team ^ 1
+            momentum_bonus = (
+                home_momentum_bonus if attacking_team == HOME else -home_momentum_bonus
             )
-            events.append(attack_outcome["event"])
-
-            if attack_outcome["rally_ends"]:
-                return RallyResult(
-                    winner=attack_outcome["winner"],
-                    events=events,
-                    duration=random.uniform(5, 30),
-                )
 
-            attacking_team = "away" if attacking_team == "home" else "home"
-            touches += 1
-
-        return RallyResult(
-            winner=random.choice(["home", "away"]),
-            events=events,
-            duration=random.uniform(15, 45),
-        )
-
-    def _simulate_serve(
-        self,
-        serving_strength: Dict,
-        receiving_strength: Dict,
-        serving_team: str,
-    ) -> Dict:
-        """Simulate service phase"""
+            success_prob = (attack_power + momentum_bonus) / (
+                attack_power + defense_power + momentum_bonus
+            )
+            success_prob = max(0.1, min(0.9, success_prob))  # Clamp between 10-90%
+
+            outcome = random.random()
+            if outcome < success_prob * 0.8:  # 80% of successful attacks are kills
+                events.append(kill_event)
+                return attacking_team
+            if outcome < success_prob:  # 20% continue rally
+                events.append(dig_event)
+                attacking_team = defending_team
+                continue
+
+            # Attack unsuccessful: 30% blocked, 70% attack error
+            events.append(block_event if random.random() < 0.3 else attack_error_event)
+            return defending_team
+
+        return random.randrange(2)
+
+    def _serve_odds(
+        self, serving_strength: Dict, receiving_strength: Dict, serving_team: int
+    ) -> Tuple[float, float, Dict, Dict, Dict]:
+        """Serve outcome thresholds and events for one serving side
+
+        Strengths are fixed for the match, so these are worked out once per
+        set rather than on every serve: (ace probability, ace-or-error
+        probability, ace event, error event, reception event). The events are
+        shared by every rally that produces them and must not be mutated.
+        """
+        serving_name = TEAM_NAMES[serving_team]
+        receiving_name = TEAM_NAMES[serving_team ^ 1]
         serve_power = serving_strength["serve"]
         receive_skill = receiving_strength["receive"]
 
         ace_prob = max(0.01, min(0.15, (serve_power - receive_skill) / 500 + 0.05))
         error_prob = max(0.02, min(0.12, (100 - serve_power) / 800 + 0.03))
 
-        outcome = random.random()
-
-        if outcome < ace_prob:
-            return {
-                "rally_ends": True,
-                "winner": serving_team,
-                "event": {
-                    "type": MatchEvent.SERVE_ACE.value,
-                    "team": serving_team,
-                    "effectiveness": min(1.0, serve_power / 100),
-                },
-            }
-        elif outcome < ace_prob + error_prob:
-            return {
-                "rally_ends": True,
-                "winner": "away" if serving_team == "home" else "home",
-                "event": {
-                    "type": MatchEvent.SERVE_ERROR.value,
-                    "team": serving_team,
-                    "effectiveness": 0.0,
-                },
-            }
-        else:
-            return {
-                "rally_ends": False,
-                "winner": None,
-                "event": {
-                    "type": MatchEvent.DIG_SAVE.value,
-                    "team": "away" if serving_team == "home" else "home",
-                    "effectiveness": min(1.0, receive_skill / 100),
-                },
-            }
+        return (
+            ace_prob,
+            ace_prob + error_prob,
+            {
+                "type": SERVE_ACE,
+                "team": serving_name,
+                "effectiveness": min(1.0, serve_power / 100),
+            },
+            {"type": SERVE_ERROR, "team": serving_name, "effectiveness": 0.0},
+            {
+                "type": DIG_SAVE,
+                "team": receiving_name,
+                "effectiveness": min(1.0, receive_skill / 100),
+            },
+        )
 
-    def _simulate_attack(
-        self, attacking_strength: Dict, defending_strength: Dict, team: str
-    ) -> Dict:
-        """Simulate attack phase"""
+    def _attack_profile(
+        self, attacking_strength: Dict, defending_strength: Dict, team: int
+    ) -> Tuple[float, float, Dict, Dict, Dict, Dict]:
+        """Attack and defense power plus the kill, dig, block and error events
+        for one attacking side
+
+        Built once per set and shared by every rally; the events must not be
+        mutated.
+        """
+        team_name = TEAM_NAMES[team]
+        other_name = TEAM_NAMES[team ^ 1]
         attack_power = attacking_strength["attack"]
         defense_power = defending_strength["defense"]
-
-        momentum_bonus = (
-            self.MOMENTUM_FACTOR * 0.1
-            if team == "home"
-            else -self.MOMENTUM_FACTOR * 0.1
-        )
-
-        success_prob = (attack_power + momentum_bonus) / (
-            attack_power + defense_power + momentum_bonus
+        attack_effectiveness = min(1.0, attack_power / 100)
+        defense_effectiveness = min(1.0, defense_power / 100)
+        return (
+            attack_power,
+            defense_power,
+            {
+                "type": ATTACK_KILL,
+                "team": team_name,
+                "effectiveness": attack_effectiveness,
+            },
+            {
+                "type": DIG_SAVE,
+                "team": other_name,
+                "effectiveness": defense_effectiveness,
+            },
+            {
+                "type": BLOCK_POINT,
+                "team": other_name,
+                "effectiveness": defense_effectiveness,
+            },
+            {"type": ATTACK_ERROR, "team": team_name, "effectiveness": 0.0},
         )
-        success_prob = max(0.1, min(0.9, success_prob))  # Clamp between 10-90%
-
-        outcome = random.random()
 
-        if outcome < success_prob * 0.8:  # 80% of successful attacks are kills
-            return {
-                "rally_ends": True,
-                "winner": team,
-                "event": {
-                    "type": MatchEvent.ATTACK_KILL.value,
-                    "team": team,
-                    "effectiveness": min(1.0, attack_power / 100),
-                },
-            }
-        elif outcome < success_prob:  # 20% continue rally
-            return {
-                "rally_ends": False,
-                "winner": None,
-                "event": {
-                    "type": MatchEvent.DIG_SAVE.value,
-                    "team": "away" if team == "home" else "home",
-                    "effectiveness": min(1.0, defense_power / 100),
-                },
-            }
-        else:  # Attack unsuccessful
-            if random.random() < 0.3:  # 30% blocked
-                return {
-                    "rally_ends": True,
-                    "winner": "away" if team == "home" else "home",
-                    "event": {
-                        "type": MatchEvent.BLOCK_POINT.value,
-                        "team": "away" if team == "home" else "home",
-                        "effectiveness": min(1.0, defense_power / 100),
-                    },
-                }
-            else:  # 70% attack error
-                return {
-                    "rally_ends": True,
-                    "winner": "away" if team == "home" else "home",
-                    "event": {
-                        "type": MatchEvent.ATTACK_ERROR.value,
-                        "team": team,
-                        "effectiveness": 0.0,
-                    },
-                }
-
-    def _apply_fatigue(self, home_team: Dict, away_team: Dict, set_duration: float):
-        """Apply fatigue effects to players after a set"""
+    def _apply_fatigue(self, set_duration: float):
+        """Apply fatigue effects to both teams after a set"""
         fatigue_amount = set_duration * self.FATIGUE_IMPACT
 
-        for team in [home_team, away_team]:
-            for player in team.get("players", []):
-                current_fatigue = player.get("condition", {}).get("fatigue", 0)
-                player.setdefault("condition", {})["fatigue"] = min(
-                    100, current_fatigue + fatigue_amount
-                )
+        for team in self.fatigue:
+            self.fatigue[team] = min(100.0, self.fatigue[team] + fatigue_amount)
 
-    def _update_momentum(self, home_points: int, away_points: int):
-        """Update momentum based on current score"""
-        point_diff = home_points - away_points
-        self.MOMENTUM_FACTOR = max(-1.0, min(1.0, point_diff * 0.1))
+    def _fatigued_strength(self, strength: Dict, team: str) -> Dict:
+        """Team strength scaled by the fatigue that side has built up"""
+        fatigue_factor = (100 - self.fatigue[team]) / 100
+        return {key: value * fatigue_factor for key, value in strength.items()}
 
-    def _calculate_attendance(self, home_team: Dict, away_team: Dict) -> int:
+    def _calculate_attendance(self, home_team: Team, away_team: Team) -> int:
         """Calculate match attendance"""
-        home_club = home_team.get("club", {})
+        home_club = home_team.club
         stadium_capacity = home_club.get("facilities", {}).get("stadiumCapacity", 1000)
 
         base_attendance = stadium_capacity * 0.6  # 60% base attendance
@@ -394,9 +406,9 @@ class VolleyballSimulator:
 
         return int(min(stadium_capacity, base_attendance * attendance_factor))
 
-    def _calculate_revenue(self, home_team: Dict, attendance: int) -> Dict[str, int]:
+    def _calculate_revenue(self, home_team: Team, attendance: int) -> Dict[str, int]:
         """Calculate match revenue"""
-        home_club = home_team.get("club", {})
+        home_club = home_team.club
         division_tier = home_club.get("divisionTier", 10)
 
         base_ticket_price = max(5, 50 - (division_tier * 3))
@@ -417,26 +429,20 @@ class VolleyballSimulator:
         home_stats = {"kills": 0, "blocks": 0, "aces": 0, "errors": 0}
         away_stats = {"kills": 0, "blocks": 0, "aces": 0, "errors": 0}
 
+        stat_for_event = MATCH_STAT_BY_EVENT.get
         for set_result in sets_results:
             for event in set_result.get("events", []):
-                team = event.get("team")
-                event_type = event.get("type")
-
-                if team == "home":
-                    stats = home_stats
+                stat = stat_for_event(event.get("type"))
+                if stat is None:
+                    continue
+                if event.get("team") == "home":
+                    home_stats[stat] += 1
                 else:
-                    stats = away_stats
-
-                if event_type == MatchEvent.ATTACK_KILL.value:
-                    stats["kills"] += 1
-                elif event_type == MatchEvent.BLOCK_POINT.value:
-                    stats["blocks"] += 1
-                elif event_type == MatchEvent.SERVE_ACE.value:
-                    stats["aces"] += 1
-                elif event_type in [
-                    MatchEvent.SERVE_ERROR.value,
-                    MatchEvent.ATTACK_ERROR.value,
-                ]:
-                    stats["errors"] += 1
+                    away_stats[stat] += 1
 
         return {"home": home_stats, "away": away_stats}
+
+
+def simulate_match_in_worker(home_team: Team, away_team: Team, tactics: Dict) -> Dict:
+    """Simulate one match with a fresh simulator, as a process pool task"""
+    return VolleyballSimulator().simulate_match(home_team, away_team, tactics)
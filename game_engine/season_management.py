@@ -1,6 +1,8 @@
 import uuid
+from collections import deque
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import Dict, List, Optional, Any, cast
+from typing import Dict, List, Optional, Any, Callable, cast
 from dataclasses import dataclass
 
 from models.season import Season, SeasonStatus
@@ -29,10 +31,19 @@ class SeasonCreationResult:
 class SeasonManager:
     """Manages season creation and competition scheduling"""
 
-    def __init__(self, firestore_helper: FirestoreHelper):
+    def __init__(
+        self, firestore_helper: FirestoreHelper, executor: Optional[Executor] = None
+    ):
         self.firestore_helper = firestore_helper
+        self._executor = executor
         self.season_config = cast(Dict[str, Any], GAME_CONFIG["SEASON"])
 
+    def _map_tasks(self, func: Callable[[Any], Any], items: List[Any]) -> List:
+        """Apply func to each item, concurrently when an executor was provided"""
+        if self._executor is None:
+            return [func(item) for item in items]
+        return list(self._executor.map(func, items))
+
     def create_season(
         self,
         season_name: str,
@@ -88,19 +99,36 @@ class SeasonManager:
                 )
 
             competitions_created = 0
-
-            for country_id in participating_countries:
-                domestic_competitions = self._schedule_domestic_competitions(
-                    season_id, country_id
+            domestic_leagues: List[Competition] = []
+
+            # One clubs read per country, shared by the domestic and continental
+            # competitions; countries are independent, so their I/O can overlap
+            clubs_by_country_tier = dict(
+                zip(
+                    participating_countries,
+                    self._map_tasks(self._get_clubs_by_tier, participating_countries),
                 )
+            )
+
+            for domestic_competitions in self._map_tasks(
+                lambda country_id: self._schedule_domestic_competitions(
+                    season_id, country_id, clubs_by_country_tier[country_id]
+                ),
+                participating_countries,
+            ):
                 competitions_created += len(domestic_competitions)
+                domestic_leagues.extend(
+                    c
+                    for c in domestic_competitions
+                    if c.type == CompetitionType.DOMESTIC_LEAGUE
+                )
 
             continental_competitions = self._schedule_continental_competitions(
-                season_id, participating_countries
+                season_id, clubs_by_country_tier
             )
             competitions_created += len(continental_competitions)
 
-            self._schedule_matches_for_season(season_id, participating_countries)
+            self._schedule_matches_for_season(season_id, domestic_leagues)
 
             return SeasonCreationResult(
                 season_id=season_id,
@@ -121,18 +149,12 @@ class SeasonManager:
             )
 
     def _schedule_matches_for_season(
-        self, season_id: str, participating_countries: List[str]
+        self, season_id: str, domestic_leagues: List[Competition]
     ):
-        """Schedule matches for all competitions in the season"""
+        """Schedule matches for the domestic leagues created for the season"""
         try:
-            competitions = self.firestore_helper.get_all_competitions()
-            season_competitions = [
-                c for c in competitions if c.get("seasonId") == season_id
-            ]
-
-            for competition in season_competitions:
-                if competition.get("type") == "domestic_league":
-                    self._schedule_league_matches(competition, season_id)
+            for league in domestic_leagues:
+                self._schedule_league_matches(league.to_dict(), season_id)
 
         except Exception as e:
             print(f"Error scheduling matches for season: {e}")
@@ -144,55 +166,66 @@ class SeasonManager:
             if len(participants) < 2:
                 return
 
-            club_ids = [p["clubId"] for p in participants]
+            club_ids: List[Optional[str]] = [p["clubId"] for p in participants]
+            if len(club_ids) % 2:
+                club_ids.append(None)  # Bye: whoever draws it sits the round out
             competition_id = competition["id"]
 
+            # Circle method: the first club stays put while the rest rotate one
+            # place each round, and the lineup's two halves face each other
+            team_count = len(club_ids)
+            half = team_count // 2
+            fixed_club_id = club_ids[0]
+            rotating_club_ids = deque(club_ids[1:])
+
+            matches = []
+            scheduled_date = datetime.now().isoformat()
             match_day = 1
-            matches_per_round = len(club_ids) // 2
-            total_rounds = (len(club_ids) - 1) * 2
+            total_rounds = (team_count - 1) * 2
 
             for round_num in range(total_rounds):
-                for match_num in range(matches_per_round):
-                    home_idx = match_num
-                    away_idx = len(club_ids) - 1 - match_num
-
-                    if round_num % 2 == 0:
-                        home_club_id = club_ids[home_idx]
-                        away_club_id = club_ids[away_idx]
-                    else:
-                        home_club_id = club_ids[away_idx]
-                        away_club_id = club_ids[home_idx]
-
-                    if home_club_id != away_club_id:
-                        match_data = {
+                lineup = [fixed_club_id, *rotating_club_ids]
+                for home_club_id, away_club_id in zip(
+                    lineup[:half], reversed(lineup[half:])
+                ):
+                    if home_club_id is None or away_club_id is None:
+                        continue
+                    if round_num % 2:
+                        home_club_id, away_club_id = away_club_id, home_club_id
+
+                    matches.append(
+                        {
                             "homeClubId": home_club_id,
                             "awayClubId": away_club_id,
                             "competitionId": competition_id,
                             "seasonId": season_id,
                             "matchDay": match_day,
-                            "scheduledDate": datetime.now().isoformat(),
+                            "scheduledDate": scheduled_date,
                             "status": "scheduled",
                         }
+                    )
 
-                        self.firestore_helper.save_scheduled_match(match_data)
-
-                club_ids = [club_ids[0]] + [club_ids[-1]] + club_ids[1:-1]
+                rotating_club_ids.rotate(1)
                 match_day += 1
 
+            # The whole fixture list goes out in batched writes
+            self.firestore_helper.save_scheduled_matches(matches)
+
         except Exception as e:
             print(f"Error scheduling league matches: {e}")
 
     def _schedule_domestic_competitions(
-        self, season_id: str, country_id: str
+        self,
+        season_id: str,
+        country_id: str,
+        clubs_by_tier: Dict[int, List[Dict[str, Any]]],
     ) -> List[Competition]:
         """Schedule domestic league and cup competitions for a country"""
         competitions = []
         country_name = COUNTRIES[country_id]["name"]
 
         for tier in range(1, self.season_config["TOTAL_DIVISIONS"] + 1):
-            clubs = self.firestore_helper.get_clubs_by_country_and_tier(
-                country_id, tier
-            )
+            clubs = clubs_by_tier.get(tier, [])
 
             if not clubs:
                 continue
@@ -233,24 +266,38 @@ class SeasonManager:
             if self.firestore_helper.create_competition_object(competition):
                 competitions.append(competition)
 
-        cup_competition = self._create_national_cup(season_id, country_id)
+        cup_competition = self._create_national_cup(
+            season_id, country_id, clubs_by_tier
+        )
         if cup_competition:
             competitions.append(cup_competition)
 
         return competitions
 
+    def _get_clubs_by_tier(self, country_id: str) -> Dict[int, List[Dict[str, Any]]]:
+        """Get a country's clubs in one read, grouped by division tier"""
+        clubs_by_tier: Dict[int, List[Dict[str, Any]]] = {}
+        for club in self.firestore_helper.get_clubs_by_country(country_id):
+            tier = club.get("divisionTier")
+            if tier is None:
+                continue  # Not in any division, so not in any competition
+            clubs_by_tier.setdefault(int(tier), []).append(club)
+        return clubs_by_tier
+
     def _create_national_cup(
-        self, season_id: str, country_id: str
+        self,
+        season_id: str,
+        country_id: str,
+        clubs_by_tier: Dict[int, List[Dict[str, Any]]],
     ) -> Optional[Competition]:
         """Create national cup competition for a country"""
         country_name = COUNTRIES[country_id]["name"]
 
-        all_clubs = []
-        for tier in range(1, self.season_config["TOTAL_DIVISIONS"] + 1):
-            clubs = self.firestore_helper.get_clubs_by_country_and_tier(
-                country_id, tier
-            )
-            all_clubs.extend(clubs)
+        all_clubs = [
+            club
+            for tier in range(1, self.season_config["TOTAL_DIVISIONS"] + 1)
+            for club in clubs_by_tier.get(tier, [])
+        ]
 
         if not all_clubs:
             return None
@@ -297,39 +344,31 @@ class SeasonManager:
         return None
 
     def _schedule_continental_competitions(
-        self, season_id: str, participating_countries: List[str]
+        self,
+        season_id: str,
+        clubs_by_country_tier: Dict[str, Dict[int, List[Dict[str, Any]]]],
     ) -> List[Competition]:
         """Schedule continental competitions"""
-        competitions = []
-
-        champions_league = self._create_continental_champions_league(
-            season_id, participating_countries
-        )
-        if champions_league:
-            competitions.append(champions_league)
-
-        professional_cup = self._create_continental_professional_cup(
-            season_id, participating_countries
-        )
-        if professional_cup:
-            competitions.append(professional_cup)
-
-        amateur_championship = self._create_continental_amateur_championship(
-            season_id, participating_countries
+        creators = [
+            self._create_continental_champions_league,
+            self._create_continental_professional_cup,
+            self._create_continental_amateur_championship,
+        ]
+        competitions = self._map_tasks(
+            lambda create: create(season_id, clubs_by_country_tier), creators
         )
-        if amateur_championship:
-            competitions.append(amateur_championship)
 
-        return competitions
+        return [competition for competition in competitions if competition]
 
     def _create_continental_champions_league(
-        self, season_id: str, participating_countries: List[str]
+        self,
+        season_id: str,
+        clubs_by_country_tier: Dict[str, Dict[int, List[Dict[str, Any]]]],
     ) -> Optional[Competition]:
         """Create Continental Champions League"""
         elite_clubs = []
-        for country_id in participating_countries:
-            clubs = self.firestore_helper.get_clubs_by_country_and_tier(country_id, 1)
-            elite_clubs.extend(clubs)
+        for clubs_by_tier in clubs_by_country_tier.values():
+            elite_clubs.extend(clubs_by_tier.get(1, []))
 
         if not elite_clubs:
             return None
@@ -371,13 +410,14 @@ class SeasonManager:
         return None
 
     def _create_continental_professional_cup(
-        self, season_id: str, participating_countries: List[str]
+        self,
+        season_id: str,
+        clubs_by_country_tier: Dict[str, Dict[int, List[Dict[str, Any]]]],
     ) -> Optional[Competition]:
         """Create Continental Professional Cup"""
         professional_clubs = []
-        for country_id in participating_countries:
-            clubs = self.firestore_helper.get_clubs_by_country_and_tier(country_id, 2)
-            professional_clubs.extend(clubs)
+        for clubs_by_tier in clubs_by_country_tier.values():
+            professional_clubs.extend(clubs_by_tier.get(2, []))
 
         if not professional_clubs:
             return None
@@ -418,12 +458,14 @@ class SeasonManager:
         return None
 
     def _create_continental_amateur_championship(
-        self, season_id: str, participating_countries: List[str]
+        self,
+        season_id: str,
+        clubs_by_country_tier: Dict[str, Dict[int, List[Dict[str, Any]]]],
     ) -> Optional[Competition]:
         """Create Continental Amateur Championship"""
         amateur_clubs = []
-        for country_id in participating_countries:
-            clubs = self.firestore_helper.get_clubs_by_country_and_tier(country_id, 10)
+        for clubs_by_tier in clubs_by_country_tier.values():
+            clubs = clubs_by_tier.get(10, [])
             if clubs:
                 amateur_clubs.append(clubs[0])
 
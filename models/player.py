@@ -71,6 +71,8 @@ class Player:
     stats: PlayerStats
     nickname: Optional[str] = None
     created_at: Optional[datetime] = None
+    # Copy of the club's division tier, so player endpoints can skip the club read
+    division_tier: Optional[int] = None
 
     def __post_init__(self):
         if self.created_at is None:
@@ -391,4 +393,5 @@ def generate_random_player(
         condition=PlayerCondition(),
         contract=contract,
         stats=PlayerStats(),
+        division_tier=division_tier,
     )
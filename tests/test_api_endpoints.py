@@ -5,8 +5,14 @@ API endpoint integration tests for Volleyball Manager
 import pytest
 import os
 import json
+import time
+import threading
+import numpy as np
+import flask
 from unittest.mock import patch
 from app import app
+from models.player import generate_random_player
+from utils.firestore_helpers import ClubView
 
 
 @pytest.fixture
@@ -86,7 +92,12 @@ class TestClubEndpoints:
 
     def test_create_club_success(self, client, mock_firestore_helper):
         """Test successful club creation"""
-        mock_firestore_helper.create_club.return_value = "new_club_123"
+
+        def create_club(club_data):
+            club_data["divisionTier"] = 14
+            return "new_club_123"
+
+        mock_firestore_helper.create_club.side_effect = create_club
         mock_firestore_helper.generate_initial_squad.return_value = ["p1", "p2", "p3"]
 
         club_data = {
@@ -106,6 +117,9 @@ class TestClubEndpoints:
         assert data["clubId"] == "new_club_123"
         assert "Club created successfully" in data["message"]
         assert data["playersGenerated"] == 3
+        mock_firestore_helper.generate_initial_squad.assert_called_once_with(
+            "new_club_123", "coastalia", 14
+        )
 
     def test_create_club_missing_fields(self, client):
         """Test club creation with missing required fields"""
@@ -119,7 +133,8 @@ class TestClubEndpoints:
 
         assert response.status_code == 400
         data = json.loads(response.data)
-        assert "Missing required field" in data["error"]
+        assert "Invalid request data" in data["error"]
+        assert "Missing required fields: countryId, ownerId" in data["details"]
 
     def test_create_club_no_json(self, client):
         """Test club creation without JSON data"""
@@ -129,6 +144,60 @@ class TestClubEndpoints:
         data = json.loads(response.data)
         assert "No JSON data provided" in data["error"]
 
+    def test_list_clubs_streams_json(self, client, mock_firestore_helper):
+        """Test the club list is streamed as a well-formed JSON object"""
+        mock_firestore_helper.iter_all_clubs.return_value = iter(
+            [{"id": "club1", "name": "Club One"}, {"id": "club2", "name": "Club Two"}]
+        )
+
+        response = client.get("/clubs/list")
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        data = json.loads(response.data)
+        assert [club["id"] for club in data["clubs"]] == ["club1", "club2"]
+
+    def test_list_clubs_read_failure_is_server_error(
+        self, client, mock_firestore_helper
+    ):
+        """Test a club stream that fails to start answers 500"""
+
+        def failing_clubs():
+            raise Exception("Firestore unavailable")
+            yield
+
+        mock_firestore_helper.iter_all_clubs.return_value = failing_clubs()
+
+        response = client.get("/clubs/list")
+
+        assert response.status_code == 500
+        assert "Firestore unavailable" in response.get_json()["error"]
+
+    def test_list_clubs_mid_stream_failure_aborts(self, client, mock_firestore_helper):
+        """Test a failure partway through never yields a complete JSON body"""
+
+        def clubs_then_failure():
+            yield {"id": "club1", "name": "Club One"}
+            raise Exception("stream reset")
+
+        mock_firestore_helper.iter_all_clubs.return_value = clubs_then_failure()
+
+        with pytest.raises(Exception, match="stream reset"):
+            client.get("/clubs/list").get_data()
+
+    def test_json_provider_uses_orjson(self):
+        """Test Flask's own JSON helpers go through the orjson provider"""
+        with app.test_request_context(
+            "/clubs",
+            method="POST",
+            data=b'{"name": "Club"}',
+            content_type="application/json",
+        ):
+            assert flask.request.get_json() == {"name": "Club"}
+            response = flask.jsonify({"playerCount": np.int64(12)})
+
+        assert json.loads(response.data) == {"playerCount": 12}
+
 
 class TestLeagueEndpoints:
     """Test league-related API endpoints"""
@@ -155,10 +224,12 @@ class TestLeagueEndpoints:
         ]
 
         mock_firestore_helper.get_league_standings.return_value = mock_standings
+        mock_firestore_helper.has_cached_standings.return_value = False
 
         response = client.get("/leagues/standings?countryId=volcania&divisionTier=1")
 
         assert response.status_code == 200
+        assert response.headers["X-Cache"] == "MISS"
         data = json.loads(response.data)
         assert data["countryId"] == "volcania"
         assert data["divisionTier"] == 1
@@ -203,11 +274,18 @@ class TestMatchEndpoints:
             {"id": "p6", "position": "OH"},
         ]
 
-        mock_firestore_helper.get_club.side_effect = [mock_home_club, mock_away_club]
-        mock_firestore_helper.get_club_players.return_value = mock_players
+        mock_firestore_helper.get_clubs_bulk.return_value = {
+            home_club_id: mock_home_club,
+            away_club_id: mock_away_club,
+        }
+        mock_firestore_helper.get_players_for_clubs.return_value = {
+            home_club_id: mock_players,
+            away_club_id: mock_players,
+        }
         mock_firestore_helper.save_match.return_value = "match_123"
 
-        with patch("app.volleyball_sim") as mock_sim:
+        with patch("app.get_sim") as mock_get_sim:
+            mock_sim = mock_get_sim.return_value
             mock_result = {
                 "homeClubId": home_club_id,
                 "awayClubId": away_club_id,
@@ -227,6 +305,102 @@ class TestMatchEndpoints:
             data = json.loads(response.data)
             assert data["matchId"] == "match_123"
             assert data["result"]["winner"] == "home"
+            # Full club documents, so they can be served from the club cache
+            mock_firestore_helper.get_clubs_bulk.assert_called_once_with(
+                [home_club_id, away_club_id]
+            )
+
+    def test_simulate_match_null_team_tactics(self, client, mock_firestore_helper):
+        """Test an explicit null for one team's tactics falls back to defaults"""
+        home_club_id = "550e8400-e29b-41d4-a716-446655440000"
+        away_club_id = "550e8400-e29b-41d4-a716-446655440001"
+        mock_players = [{"id": f"p{i}", "position": "OH"} for i in range(6)]
+        mock_firestore_helper.get_clubs_bulk.return_value = {
+            home_club_id: {"name": "Home Team"},
+            away_club_id: {"name": "Away Team"},
+        }
+        mock_firestore_helper.get_players_for_clubs.return_value = {
+            home_club_id: mock_players,
+            away_club_id: mock_players,
+        }
+        mock_firestore_helper.save_match.return_value = "match_123"
+
+        with patch("app.get_sim") as mock_get_sim:
+            mock_sim = mock_get_sim.return_value
+            mock_sim.simulate_match.return_value = {
+                "homeClubId": home_club_id,
+                "awayClubId": away_club_id,
+                "result": {"winner": "home", "homeSets": 3, "awaySets": 0},
+            }
+            response = client.post(
+                "/matches/simulate",
+                data=json.dumps(
+                    {
+                        "homeClubId": home_club_id,
+                        "awayClubId": away_club_id,
+                        "tactics": {"home": None, "away": {"style": "attacking"}},
+                    }
+                ),
+                content_type="application/json",
+            )
+
+        assert response.status_code == 200
+        tactics = mock_sim.simulate_match.call_args.args[2]
+        assert tactics["home"] == {
+            "formation": "5-1",
+            "intensity": 1.0,
+            "style": "balanced",
+        }
+        assert tactics["away"]["style"] == "attacking"
+        assert tactics["away"]["formation"] == "5-1"
+
+    def test_simulate_match_async_save(self, client, mock_firestore_helper):
+        """Test the response carries a matchId before the save completes"""
+        home_club_id = "550e8400-e29b-41d4-a716-446655440000"
+        away_club_id = "550e8400-e29b-41d4-a716-446655440001"
+        mock_players = [{"id": f"p{i}", "position": "OH"} for i in range(6)]
+        mock_firestore_helper.get_clubs_bulk.return_value = {
+            home_club_id: {"name": "Home Team"},
+            away_club_id: {"name": "Away Team"},
+        }
+        mock_firestore_helper.get_players_for_clubs.return_value = {
+            home_club_id: mock_players,
+            away_club_id: mock_players,
+        }
+        saved = threading.Event()
+        mock_firestore_helper.save_match.side_effect = lambda data: saved.set()
+
+        with patch("app.get_sim") as mock_get_sim, patch("app.ASYNC_MATCH_SAVES", True):
+            mock_get_sim.return_value.simulate_match.return_value = {
+                "homeClubId": home_club_id,
+                "awayClubId": away_club_id,
+                "result": {"winner": "home", "homeSets": 3, "awaySets": 0},
+            }
+            response = client.post(
+                "/matches/simulate",
+                data=json.dumps(
+                    {"homeClubId": home_club_id, "awayClubId": away_club_id}
+                ),
+                content_type="application/json",
+            )
+
+        assert response.status_code == 200
+        match_id = response.get_json()["matchId"]
+        assert saved.wait(1)
+        saved_match = mock_firestore_helper.save_match.call_args.args[0]
+        assert saved_match["id"] == match_id
+        assert "matchId" not in saved_match
+
+    def test_hot_endpoints_bypass_restx_dispatch(self):
+        """Test the hottest routes dispatch to plain views but stay documented"""
+        from app import MatchSimulation, PlayerContractRenewal
+
+        for resource in (MatchSimulation, PlayerContractRenewal):
+            view = app.view_functions[resource.endpoint]
+            assert getattr(view, "view_class", None) is None
+
+        spec = app.test_client().get("/swagger.json").get_json()
+        assert "/matches/simulate" in spec["paths"]
 
     def test_simulate_match_missing_clubs(self, client):
         """Test match simulation with missing club IDs"""
@@ -245,8 +419,8 @@ class TestMatchEndpoints:
 
     def test_simulate_match_club_not_found(self, client, mock_firestore_helper):
         """Test match simulation with non-existent club"""
-        with patch("app.volleyball_sim"):
-            mock_firestore_helper.get_club.side_effect = [None, None]
+        with patch("app.get_sim"):
+            mock_firestore_helper.get_clubs_bulk.return_value = {}
 
             # Use valid UUIDs for club IDs
             home_club_id = "550e8400-e29b-41d4-a716-446655440000"
@@ -263,6 +437,211 @@ class TestMatchEndpoints:
             data = json.loads(response.data)
             assert "club not found" in data["error"].lower()
 
+    def test_simulate_match_club_read_error(self, client, mock_firestore_helper):
+        """Test a failed club read is a server error, not a missing club"""
+        with patch("app.get_sim"):
+            mock_firestore_helper.get_clubs_bulk.side_effect = Exception("down")
+
+            match_data = {
+                "homeClubId": "550e8400-e29b-41d4-a716-446655440000",
+                "awayClubId": "550e8400-e29b-41d4-a716-446655440001",
+            }
+
+            response = client.post(
+                "/matches/simulate",
+                data=json.dumps(match_data),
+                content_type="application/json",
+            )
+
+            assert response.status_code == 500
+            assert response.get_json()["details"] == "Failed to retrieve club data"
+
+    def test_simulate_match_roster_read_error(self, client, mock_firestore_helper):
+        """Test a failed roster read is a server error, not too few players"""
+        home_club_id = "550e8400-e29b-41d4-a716-446655440000"
+        away_club_id = "550e8400-e29b-41d4-a716-446655440001"
+        mock_firestore_helper.get_clubs_bulk.return_value = {
+            home_club_id: {"id": home_club_id},
+            away_club_id: {"id": away_club_id},
+        }
+        mock_firestore_helper.get_players_for_clubs.side_effect = Exception("down")
+
+        with patch("app.get_sim"):
+            response = client.post(
+                "/matches/simulate",
+                data=json.dumps(
+                    {"homeClubId": home_club_id, "awayClubId": away_club_id}
+                ),
+                content_type="application/json",
+            )
+
+        assert response.status_code == 500
+        assert response.get_json()["details"] == "Failed to retrieve team players"
+
+    def test_simulate_match_roster_timeout(self, client, mock_firestore_helper):
+        """Test a stalled roster read fails the request instead of hanging"""
+        home_club_id = "550e8400-e29b-41d4-a716-446655440000"
+        away_club_id = "550e8400-e29b-41d4-a716-446655440001"
+        mock_firestore_helper.get_clubs_bulk.return_value = {
+            home_club_id: {"id": home_club_id},
+            away_club_id: {"id": away_club_id},
+        }
+        mock_firestore_helper.get_players_for_clubs.side_effect = (
+            lambda club_ids, field_paths=None: time.sleep(0.5)
+        )
+
+        with patch("app.get_sim"), patch("app.FIRESTORE_FETCH_TIMEOUT_SECONDS", 0.05):
+            response = client.post(
+                "/matches/simulate",
+                data=json.dumps(
+                    {"homeClubId": home_club_id, "awayClubId": away_club_id}
+                ),
+                content_type="application/json",
+            )
+
+        assert response.status_code == 500
+        assert response.get_json()["details"] == "Timed out retrieving team players"
+
+    def test_process_scheduled_matches_batches_reads(
+        self, client, mock_firestore_helper
+    ):
+        """Test scheduled match processing reads each club only once"""
+        mock_firestore_helper.get_scheduled_matches_up_to_day.return_value = [
+            {"id": "m1", "homeClubId": "club_a", "awayClubId": "club_b"},
+            {"id": "m2", "homeClubId": "club_b", "awayClubId": "club_a"},
+        ]
+        mock_firestore_helper.get_clubs_bulk.return_value = {
+            "club_a": {"name": "Club A"},
+            "club_b": {"name": "Club B"},
+        }
+        mock_firestore_helper.get_players_for_clubs.side_effect = (
+            lambda club_ids, field_paths=None: {
+                club_id: [{"id": f"{club_id}_p{i}", "position": "OH"} for i in range(7)]
+                for club_id in club_ids
+            }
+        )
+
+        response = client.post(
+            "/matches/process-scheduled",
+            data=json.dumps({"currentMatchDay": 2}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["processedCount"] == 2
+        mock_firestore_helper.get_clubs_bulk.assert_called_once()
+        mock_firestore_helper.get_players_for_clubs.assert_called_once()
+        assert mock_firestore_helper.update_match_status.call_count == 2
+
+    def test_process_scheduled_matches_without_body(
+        self, client, mock_firestore_helper
+    ):
+        """Test the request body is optional and defaults to match day 1"""
+        mock_firestore_helper.get_scheduled_matches_up_to_day.return_value = []
+
+        with patch("app.get_sim"):
+            response = client.post("/matches/process-scheduled")
+
+        assert response.status_code == 200
+        mock_firestore_helper.get_scheduled_matches_up_to_day.assert_called_once_with(1)
+
+    def test_simulate_batch_success(self, client, mock_firestore_helper):
+        """Test batched simulation reads clubs once and saves all results together"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        club_a = "550e8400-e29b-41d4-a716-446655440000"
+        club_b = "550e8400-e29b-41d4-a716-446655440001"
+        club_c = "550e8400-e29b-41d4-a716-446655440002"
+
+        mock_firestore_helper.get_clubs_bulk.return_value = {
+            club_a: {"name": "Club A"},
+            club_b: {"name": "Club B"},
+        }
+        mock_firestore_helper.get_players_for_clubs.side_effect = (
+            lambda club_ids, field_paths=None: {
+                club_id: [{"id": f"{club_id}_p{i}", "position": "OH"} for i in range(6)]
+                for club_id in club_ids
+            }
+        )
+        mock_firestore_helper.save_matches.return_value = ["match_1", "match_2"]
+
+        batch_data = {
+            "matches": [
+                {"homeClubId": club_a, "awayClubId": club_c},
+                {"homeClubId": club_a, "awayClubId": club_b},
+                {"homeClubId": club_b, "awayClubId": club_a},
+            ]
+        }
+
+        with patch("app.simulation_pool", ThreadPoolExecutor(max_workers=2)):
+            response = client.post(
+                "/matches/simulate-batch",
+                data=json.dumps(batch_data),
+                content_type="application/json",
+            )
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["simulatedCount"] == 2
+        assert [m["matchId"] for m in data["matches"]] == ["match_1", "match_2"]
+        assert [m["index"] for m in data["matches"]] == [1, 2]
+        assert data["skipped"] == [{"index": 0, "reason": "Club not found"}]
+        mock_firestore_helper.get_clubs_bulk.assert_called_once()
+        mock_firestore_helper.save_matches.assert_called_once()
+
+    def test_simulate_batch_roster_timeout(self, client, mock_firestore_helper):
+        """Test a stalled roster read fails the batch instead of hanging"""
+        club_a = "550e8400-e29b-41d4-a716-446655440000"
+        club_b = "550e8400-e29b-41d4-a716-446655440001"
+        mock_firestore_helper.get_clubs_bulk.return_value = {
+            club_a: {"name": "Club A"},
+            club_b: {"name": "Club B"},
+        }
+        mock_firestore_helper.get_players_for_clubs.side_effect = (
+            lambda club_ids, field_paths=None: time.sleep(0.5)
+        )
+
+        with patch("app.FIRESTORE_FETCH_TIMEOUT_SECONDS", 0.05):
+            response = client.post(
+                "/matches/simulate-batch",
+                data=json.dumps(
+                    {"matches": [{"homeClubId": club_a, "awayClubId": club_b}]}
+                ),
+                content_type="application/json",
+            )
+
+        assert response.status_code == 500
+        assert response.get_json()["details"] == "Timed out retrieving team players"
+        mock_firestore_helper.save_matches.assert_not_called()
+
+    def test_simulate_batch_invalid_club_id(self, client):
+        """Test batched simulation rejects malformed club IDs"""
+        batch_data = {"matches": [{"homeClubId": "bad", "awayClubId": "worse"}]}
+
+        response = client.post(
+            "/matches/simulate-batch",
+            data=json.dumps(batch_data),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert "Invalid club ID format" in data["error"]
+
+    def test_get_sim_is_per_thread(self):
+        """Test each thread gets and reuses its own simulator instance"""
+        import threading
+        from app import get_sim
+
+        other_thread_sims = []
+        thread = threading.Thread(target=lambda: other_thread_sims.append(get_sim()))
+        thread.start()
+        thread.join()
+
+        assert get_sim() is get_sim()
+        assert other_thread_sims[0] is not get_sim()
+
     def test_simulate_match_invalid_club_id_format(self, client):
         """Test match simulation with invalid club ID format"""
         match_data = {"homeClubId": "invalid_id", "awayClubId": "also_invalid"}
@@ -278,10 +657,36 @@ class TestMatchEndpoints:
         assert "Invalid club ID format" in data["error"]
         assert "Club IDs must be valid UUIDs" in data["details"]
 
+    def test_simulate_match_rejects_trailing_newline_in_club_id(self, client):
+        """Test a UUID followed by a newline is not accepted as a club ID"""
+        match_data = {
+            "homeClubId": "550e8400-e29b-41d4-a716-446655440000\n",
+            "awayClubId": "550e8400-e29b-41d4-a716-446655440001",
+        }
+
+        response = client.post(
+            "/matches/simulate",
+            data=json.dumps(match_data),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+
 
 class TestHealthEndpoint:
     """Test health check endpoint"""
 
+    def test_health_check_does_not_wait_for_startup(self, client):
+        """Test /health answers while Firestore is still connecting"""
+        with patch("app.services_ready", threading.Event()), patch(
+            "app.SERVICE_INIT_WAIT_SECONDS", 5
+        ):
+            start = time.time()
+            response = client.get("/health")
+
+        assert time.time() - start < 1
+        assert response.status_code in (200, 503)
+
     def test_health_check_unhealthy(self, client):
         """Test health check endpoint when services are unavailable"""
         response = client.get("/health")
@@ -343,6 +748,37 @@ class TestAuthBypass:
                 del os.environ["SKIP_AUTH"]
 
 
+class TestAuthTokenCache:
+    """Test reuse of verified Firebase ID tokens"""
+
+    def test_verify_token_reuses_unexpired_token(self):
+        """Test a valid token is only verified once"""
+        from utils import auth as auth_utils
+
+        decoded = {"uid": "user_1", "exp": time.time() + 3600}
+        with patch.object(
+            auth_utils.auth, "verify_id_token", return_value=decoded
+        ) as mock_verify:
+            auth_utils.verify_token("cached-token")
+            result = auth_utils.verify_token("cached-token")
+
+        assert result["uid"] == "user_1"
+        mock_verify.assert_called_once_with("cached-token")
+
+    def test_verify_token_rechecks_expiring_token(self):
+        """Test a token close to expiry is verified again"""
+        from utils import auth as auth_utils
+
+        decoded = {"uid": "user_1", "exp": time.time() + 1}
+        with patch.object(
+            auth_utils.auth, "verify_id_token", return_value=decoded
+        ) as mock_verify:
+            auth_utils.verify_token("expiring-token")
+            auth_utils.verify_token("expiring-token")
+
+        assert mock_verify.call_count == 2
+
+
 class TestPlayerEndpoints:
     """Test player-related API endpoints"""
 
@@ -388,7 +824,9 @@ class TestPlayerEndpoints:
         """Test successful player creation"""
         mock_club_data = {"id": "test_club", "name": "Test Club", "divisionTier": 10}
 
-        mock_firestore_helper.get_club.return_value = mock_club_data
+        mock_firestore_helper.get_club_view.return_value = ClubView.from_dict(
+            "test_club", mock_club_data
+        )
         mock_firestore_helper.save_player.return_value = "new_player_123"
 
         player_data = {
@@ -409,6 +847,24 @@ class TestPlayerEndpoints:
         assert data["playerId"] == "new_player_123"
         assert "Player created successfully" in data["message"]
 
+    def test_create_player_non_json_body(self, client, mock_firestore_helper):
+        """Test player creation rejects a body that is not JSON"""
+        response = client.post("/players", data="clubId=test_club")
+
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert "No JSON data provided" in data["error"]
+
+    def test_create_player_malformed_json(self, client, mock_firestore_helper):
+        """Test player creation rejects a JSON body that does not parse"""
+        response = client.post(
+            "/players", data='{"clubId": ', content_type="application/json"
+        )
+
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert "No JSON data provided" in data["error"]
+
     def test_create_player_underage_professional(self, client, mock_firestore_helper):
         """Test player creation with underage player for professional division"""
         mock_club_data = {
@@ -417,7 +873,9 @@ class TestPlayerEndpoints:
             "divisionTier": 5,  # Professional division
         }
 
-        mock_firestore_helper.get_club.return_value = mock_club_data
+        mock_firestore_helper.get_club_view.return_value = ClubView.from_dict(
+            "test_club", mock_club_data
+        )
 
         player_data = {
             "clubId": "test_club",
@@ -484,18 +942,11 @@ class TestPlayerEndpoints:
 
         mock_club_data = {"id": "test_club", "divisionTier": 10}
 
-        mock_similar_players = [
-            {"contract": {"salary": 45000}},
-            {"contract": {"salary": 55000}},
-            {"contract": {"salary": 50000}},
-        ]
-
         mock_firestore_helper.get_player.return_value = mock_player_data
-        mock_firestore_helper.get_club.return_value = mock_club_data
-        mock_firestore_helper.get_players_by_division_and_position.return_value = (
-            mock_similar_players
+        mock_firestore_helper.get_club_view.return_value = ClubView.from_dict(
+            "test_club", mock_club_data
         )
-        mock_firestore_helper.update_player.return_value = True
+        mock_firestore_helper.get_similar_salary_stats.return_value = (50000, 3)
 
         renewal_data = {
             "offeredSalary": 60000,  # Above 110% of average (55000)
@@ -512,6 +963,26 @@ class TestPlayerEndpoints:
         data = json.loads(response.data)
         assert data["accepted"] == True
         assert "accepted and updated" in data["message"]
+        mock_firestore_helper.update_player.assert_called_once_with(
+            "test_player",
+            {"contract.salary": 60000, "contract.years_remaining": 3},
+        )
+
+    def test_contract_renewal_invalid_salary_type(self, client, mock_firestore_helper):
+        """Test contract renewal rejects a non-integer salary before any reads"""
+        renewal_data = {"offeredSalary": "lots", "yearsOffered": 3}
+
+        response = client.post(
+            "/players/test_player/renew-contract",
+            data=json.dumps(renewal_data),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert "Invalid request data" in data["error"]
+        assert "offeredSalary" in data["details"]
+        mock_firestore_helper.get_player.assert_not_called()
 
     def test_contract_renewal_rejected(self, client, mock_firestore_helper):
         """Test contract renewal that gets rejected"""
@@ -561,17 +1032,11 @@ class TestPlayerEndpoints:
 
         mock_club_data = {"id": "test_club", "divisionTier": 10}
 
-        mock_similar_players = [
-            {"contract": {"salary": 60000}},
-            {"contract": {"salary": 65000}},
-            {"contract": {"salary": 70000}},
-        ]
-
         mock_firestore_helper.get_player.return_value = mock_player_data
-        mock_firestore_helper.get_club.return_value = mock_club_data
-        mock_firestore_helper.get_players_by_division_and_position.return_value = (
-            mock_similar_players
+        mock_firestore_helper.get_club_view.return_value = ClubView.from_dict(
+            "test_club", mock_club_data
         )
+        mock_firestore_helper.get_similar_salary_stats.return_value = (65000, 3)
 
         renewal_data = {
             "offeredSalary": 50000,  # Below 110% of average (71500)
@@ -589,6 +1054,26 @@ class TestPlayerEndpoints:
         assert data["accepted"] == False
         assert "rejected" in data["message"]
 
+    def test_contract_renewal_uses_player_division_tier(
+        self, client, mock_firestore_helper
+    ):
+        """Test a player carrying its club's tier skips the club read"""
+        player = generate_random_player("test_club", "volcania", "OH", 4)
+        mock_firestore_helper.get_player.return_value = player.to_dict()
+        mock_firestore_helper.get_similar_salary_stats.return_value = (0, 0)
+
+        response = client.post(
+            "/players/test_player/renew-contract",
+            data=json.dumps({"offeredSalary": 1, "yearsOffered": 1}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        mock_firestore_helper.get_club_view.assert_not_called()
+        mock_firestore_helper.get_similar_salary_stats.assert_called_once_with(
+            4, "OH", "volcania"
+        )
+
     def test_player_retirement_young_player(self, client, mock_firestore_helper):
         """Test retirement for young player (should not retire)"""
         mock_player_data = {
@@ -695,10 +1180,10 @@ class TestPlayerEndpoints:
         mock_target_club = {"id": "target_club", "divisionTier": 5}  # Better division
 
         mock_firestore_helper.get_player.return_value = mock_player_data
-        mock_firestore_helper.get_club.side_effect = [
-            mock_current_club,
-            mock_target_club,
-        ]
+        mock_firestore_helper.get_club_views.return_value = {
+            "current_club": ClubView.from_dict("current_club", mock_current_club),
+            "target_club": ClubView.from_dict("target_club", mock_target_club),
+        }
 
         transfer_data = {
             "offeredSalary": 60000,  # Higher salary
@@ -767,10 +1252,10 @@ class TestPlayerEndpoints:
         mock_target_club = {"id": "target_club", "divisionTier": 10}  # Worse division
 
         mock_firestore_helper.get_player.return_value = mock_player_data
-        mock_firestore_helper.get_club.side_effect = [
-            mock_current_club,
-            mock_target_club,
-        ]
+        mock_firestore_helper.get_club_views.return_value = {
+            "current_club": ClubView.from_dict("current_club", mock_current_club),
+            "target_club": ClubView.from_dict("target_club", mock_target_club),
+        }
 
         transfer_data = {
             "offeredSalary": 45000,  # Lower salary
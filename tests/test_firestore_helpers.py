@@ -2,7 +2,9 @@
 Tests for Firestore helper functions
 """
 
-from unittest.mock import Mock
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 from utils.firestore_helpers import FirestoreHelper
 
 
@@ -33,6 +35,35 @@ class TestFirestoreHelper:
         self.mock_db.collection.assert_called_with("clubs")
         mock_doc_ref.set.assert_called_once()
 
+    def test_initial_squad_takes_new_club_tier(self):
+        """Test a new club's squad is generated for the tier it was placed in"""
+        batch = self.mock_db.batch.return_value
+        club_data = {
+            "name": "Test Club",
+            "countryId": "testland",
+            "ownerId": "test_owner",
+            "divisionTier": 14,
+        }
+
+        club_id = self.firestore_helper.create_club(club_data)
+        self.firestore_helper.generate_initial_squad(
+            club_id, "testland", club_data["divisionTier"]
+        )
+
+        players = [call.args[1] for call in batch.set.call_args_list]
+        assert len(players) == 12
+        assert {p["division_tier"] for p in players} == {14}
+
+    def test_create_club_records_assigned_tier(self):
+        """Test a club created without a tier reports the one it was given"""
+        club_data = {"name": "Test Club", "countryId": "testland", "ownerId": "o"}
+
+        self.firestore_helper.create_club(club_data)
+
+        stored = self.mock_db.collection.return_value.document.return_value.set
+        assert 10 <= club_data["divisionTier"] <= 19
+        assert stored.call_args.args[0]["divisionTier"] == club_data["divisionTier"]
+
     def test_get_club_existing(self):
         """Test getting existing club"""
         mock_doc = Mock()
@@ -68,6 +99,142 @@ class TestFirestoreHelper:
 
         assert result is None
 
+    def test_get_club_cached(self):
+        """Test repeated club reads are served from the cache"""
+        mock_doc = Mock()
+        mock_doc.exists = True
+        mock_doc.to_dict.return_value = {"name": "Test Club"}
+
+        mock_doc_ref = Mock()
+        mock_doc_ref.get.return_value = mock_doc
+        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
+
+        first = self.firestore_helper.get_club("test_club")
+        first["players"] = []
+        second = self.firestore_helper.get_club("test_club")
+
+        assert second == {"name": "Test Club"}
+        mock_doc_ref.get.assert_called_once()
+
+    def test_get_club_registers_listener_and_serves_pushed_updates(self):
+        """Test a watched club is kept current by its snapshot listener"""
+        helper = FirestoreHelper(self.mock_db, watch_clubs=True)
+
+        mock_doc = Mock()
+        mock_doc.exists = True
+        mock_doc.to_dict.return_value = {"name": "Old Name"}
+
+        mock_doc_ref = Mock()
+        mock_doc_ref.get.return_value = mock_doc
+        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
+
+        helper.get_club("test_club")
+        on_snapshot = mock_doc_ref.on_snapshot.call_args.args[0]
+
+        pushed_doc = Mock()
+        pushed_doc.exists = True
+        pushed_doc.to_dict.return_value = {"name": "New Name"}
+        on_snapshot([pushed_doc], [], None)
+
+        assert helper.get_club("test_club") == {"name": "New Name"}
+        mock_doc_ref.get.assert_called_once()
+        mock_doc_ref.on_snapshot.assert_called_once()
+
+    def test_club_listeners_evict_least_recently_read(self):
+        """Test the oldest listener is unsubscribed once the limit is hit"""
+        with patch("utils.firestore_helpers.CLUB_WATCH_LIMIT", 1):
+            helper = FirestoreHelper(self.mock_db, watch_clubs=True)
+
+        watches = {}
+
+        def document(club_id):
+            mock_doc = Mock()
+            mock_doc.exists = True
+            mock_doc.to_dict.return_value = {"name": club_id}
+            doc_ref = Mock()
+            doc_ref.get.return_value = mock_doc
+            doc_ref.on_snapshot.return_value = watches.setdefault(club_id, Mock())
+            return doc_ref
+
+        self.mock_db.collection.return_value.document.side_effect = document
+
+        helper.get_club("club_1")
+        helper.get_club("club_2")
+
+        watches["club_1"].unsubscribe.assert_called_once()
+        watches["club_2"].unsubscribe.assert_not_called()
+
+    def test_update_player_invalidates_cache(self):
+        """Test player writes evict the cached document"""
+        mock_doc = Mock()
+        mock_doc.exists = True
+        mock_doc.id = "player_1"
+        mock_doc.to_dict.return_value = {"age": 25}
+
+        mock_doc_ref = Mock()
+        mock_doc_ref.get.return_value = mock_doc
+        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
+
+        self.firestore_helper.get_player("player_1")
+        self.firestore_helper.update_player("player_1", {"age": 26})
+        self.firestore_helper.get_player("player_1")
+
+        assert mock_doc_ref.get.call_count == 2
+
+    def test_get_clubs_bulk(self):
+        """Test batched club retrieval skips missing clubs"""
+        mock_docs = []
+        for club_id, exists in [("home_club", True), ("missing_club", False)]:
+            mock_doc = Mock()
+            mock_doc.id = club_id
+            mock_doc.exists = exists
+            mock_doc.to_dict.return_value = {"name": f"{club_id} name"}
+            mock_docs.append(mock_doc)
+
+        self.mock_db.get_all.return_value = mock_docs
+
+        clubs = self.firestore_helper.get_clubs_bulk(["home_club", "missing_club"])
+
+        assert clubs == {"home_club": {"name": "home_club name"}}
+        self.mock_db.get_all.assert_called_once()
+        self.mock_db.collection.assert_called_with("clubs")
+
+    def test_get_clubs_bulk_raises_read_errors(self):
+        """Test a failed batched read is raised rather than reported as no clubs"""
+        self.mock_db.get_all.side_effect = Exception("unavailable")
+
+        with pytest.raises(Exception, match="unavailable"):
+            self.firestore_helper.get_clubs_bulk(["home_club"])
+
+    def test_get_clubs_bulk_projected_not_cached(self):
+        """Test projected club reads pass field paths and bypass the cache"""
+        mock_doc = Mock()
+        mock_doc.id = "home_club"
+        mock_doc.exists = True
+        mock_doc.to_dict.return_value = {"divisionTier": 3}
+        self.mock_db.get_all.return_value = [mock_doc]
+
+        fields = ["divisionTier"]
+        self.firestore_helper.get_clubs_bulk(["home_club"], field_paths=fields)
+        self.firestore_helper.get_clubs_bulk(["home_club"], field_paths=fields)
+
+        assert self.mock_db.get_all.call_count == 2
+        assert self.mock_db.get_all.call_args.kwargs["field_paths"] == fields
+
+    def test_get_club_views(self):
+        """Test club views expose typed fields with the usual defaults"""
+        mock_doc = Mock()
+        mock_doc.id = "home_club"
+        mock_doc.exists = True
+        mock_doc.to_dict.return_value = {"name": "Home", "divisionTier": 3}
+        self.mock_db.get_all.return_value = [mock_doc]
+
+        views = self.firestore_helper.get_club_views(["home_club"])
+
+        assert views["home_club"].division_tier == 3
+        assert views["home_club"].name == "Home"
+        assert views["home_club"].country_id == ""
+
     def test_get_club_players(self):
         """Test getting club players"""
         mock_player_docs = []
@@ -96,6 +263,95 @@ class TestFirestoreHelper:
             "clubId", "==", "test_club"
         )
 
+    def test_get_players_for_clubs(self):
+        """Test several rosters are read with one query and split by club"""
+        mock_player_docs = []
+        for i, club_id in enumerate(["home_club", "away_club", "home_club"]):
+            mock_doc = Mock()
+            mock_doc.id = f"player_{i}"
+            mock_doc.to_dict.return_value = {"clubId": club_id}
+            mock_player_docs.append(mock_doc)
+
+        mock_query = Mock()
+        mock_query.stream.return_value = mock_player_docs
+        self.mock_db.collection.return_value.where.return_value = mock_query
+
+        rosters = self.firestore_helper.get_players_for_clubs(
+            ["home_club", "away_club", "empty_club"]
+        )
+
+        assert [p["id"] for p in rosters["home_club"]] == ["player_0", "player_2"]
+        assert [p["id"] for p in rosters["away_club"]] == ["player_1"]
+        assert rosters["empty_club"] == []
+        self.mock_db.collection.return_value.where.assert_called_once_with(
+            "clubId", "in", ["home_club", "away_club", "empty_club"]
+        )
+
+    def test_get_players_for_clubs_read_error(self):
+        """Test a failed roster read is raised rather than reported as no players"""
+        self.mock_db.collection.return_value.where.return_value.stream.side_effect = (
+            Exception("unavailable")
+        )
+
+        with pytest.raises(Exception, match="unavailable"):
+            self.firestore_helper.get_players_for_clubs(["test_club"])
+
+    def test_rosters_cached_until_player_write(self):
+        """Test rosters are served from cache until a player is written"""
+        mock_doc = Mock()
+        mock_doc.id = "player_1"
+        mock_doc.to_dict.return_value = {"clubId": "test_club"}
+
+        mock_query = Mock()
+        mock_query.stream.return_value = [mock_doc]
+        self.mock_db.collection.return_value.where.return_value = mock_query
+
+        self.firestore_helper.get_club_players("test_club")
+        rosters = self.firestore_helper.get_players_for_clubs(["test_club"])
+        assert [p["id"] for p in rosters["test_club"]] == ["player_1"]
+        assert mock_query.stream.call_count == 1
+
+        self.firestore_helper.update_player("player_1", {"clubId": "other_club"})
+        self.firestore_helper.get_club_players("test_club")
+        assert mock_query.stream.call_count == 2
+
+    def test_get_players_for_clubs_projected(self):
+        """Test projected rosters select clubId and are isolated copies"""
+        mock_doc = Mock()
+        mock_doc.id = "player_1"
+        mock_doc.to_dict.return_value = {
+            "clubId": "test_club",
+            "attributes": {"spikePower": 70},
+        }
+
+        mock_where = self.mock_db.collection.return_value.where.return_value
+        mock_where.select.return_value.stream.return_value = [mock_doc]
+
+        rosters = self.firestore_helper.get_players_for_clubs(
+            ["test_club"], field_paths=["attributes.spikePower"]
+        )
+        rosters["test_club"][0]["clubId"] = "other_club"
+
+        mock_where.select.assert_called_once_with(["attributes.spikePower", "clubId"])
+        rosters = self.firestore_helper.get_players_for_clubs(
+            ["test_club"], field_paths=["attributes.spikePower"]
+        )
+        assert rosters["test_club"][0]["clubId"] == "test_club"
+        mock_where.select.return_value.stream.assert_called_once()
+
+    def test_generate_initial_squad_single_commit(self):
+        """Test the new squad is written in one batch commit"""
+        batch = self.mock_db.batch.return_value
+
+        player_ids = self.firestore_helper.generate_initial_squad(
+            "club_1", "testland", 10
+        )
+
+        assert len(player_ids) == 12
+        assert batch.set.call_count == 12
+        batch.commit.assert_called_once()
+        self.mock_db.collection.return_value.document.return_value.set.assert_not_called()
+
     def test_save_match(self):
         """Test saving match result"""
         mock_match_doc_ref = Mock()
@@ -144,6 +400,123 @@ class TestFirestoreHelper:
 
         mock_home_club_doc_ref.update.assert_called_once()
         mock_away_club_doc_ref.update.assert_called_once()
+        # Stats are applied as increments without re-reading the clubs
+        mock_home_club_doc_ref.get.assert_not_called()
+        mock_away_club_doc_ref.get.assert_not_called()
+
+    def test_save_matches_batches_writes(self):
+        """Test batched match saves commit once with one update per club"""
+        mock_batch = self.mock_db.batch.return_value
+
+        matches = [
+            {
+                "homeClubId": "club_a",
+                "awayClubId": "club_b",
+                "result": {"winner": "home", "homeSets": 3, "awaySets": 1},
+            },
+            {
+                "homeClubId": "club_b",
+                "awayClubId": "club_a",
+                "result": {"winner": "home", "homeSets": 3, "awaySets": 2},
+            },
+        ]
+
+        match_ids = self.firestore_helper.save_matches(matches)
+
+        assert len(match_ids) == 2
+        assert [m["id"] for m in matches] == match_ids
+        assert mock_batch.set.call_count == 2
+        assert mock_batch.update.call_count == 2
+        mock_batch.commit.assert_called_once()
+
+    def test_save_scheduled_matches_batches_writes(self):
+        """Test scheduled matches are written through the write batch"""
+        mock_batch = self.mock_db.batch.return_value
+        mock_match_ref = self.mock_db.collection.return_value.document.return_value
+
+        matches = [
+            {"homeClubId": "club_a", "awayClubId": "club_b", "matchDay": 1},
+            {"homeClubId": "club_b", "awayClubId": "club_a", "matchDay": 2},
+        ]
+
+        match_ids = self.firestore_helper.save_scheduled_matches(matches)
+
+        assert [m["id"] for m in matches] == match_ids
+        assert all(m["createdAt"] == m["updatedAt"] for m in matches)
+        assert mock_batch.set.call_count == 2
+        mock_batch.commit.assert_called_once()
+        mock_match_ref.set.assert_not_called()
+
+    def test_match_events_stored_compressed(self):
+        """Test rally events are written compressed and restored on read"""
+        events = [{"type": "attack_kill", "team": "home", "effectiveness": 0.7}]
+        match = {
+            "homeClubId": "club_a",
+            "awayClubId": "club_b",
+            "result": {
+                "winner": "home",
+                "homeSets": 3,
+                "awaySets": 0,
+                "sets": [{"homePoints": 25, "awayPoints": 20, "events": events}],
+            },
+        }
+        mock_match_ref = self.mock_db.collection.return_value.document.return_value
+
+        self.firestore_helper.save_match(match)
+
+        stored = mock_match_ref.set.call_args.args[0]
+        assert "events" not in stored["result"]["sets"][0]
+        assert isinstance(stored["eventLog"], bytes)
+        assert match["result"]["sets"][0]["events"] == events
+
+        mock_doc = Mock()
+        mock_doc.id = stored["id"]
+        mock_doc.to_dict.return_value = stored
+        self.mock_db.collection.return_value.stream.return_value = [mock_doc]
+
+        [loaded] = self.firestore_helper.get_all_matches()
+
+        assert "eventLog" not in loaded
+        assert loaded["result"]["sets"][0]["events"] == events
+
+    def test_commit_writes_chunks_batches_and_invalidates(self):
+        """Test writes commit in per-call batches of 500 and evict cached docs"""
+        mock_doc = Mock()
+        mock_doc.exists = True
+        mock_doc.id = "player_1"
+        mock_doc.to_dict.return_value = {"age": 25}
+
+        mock_doc_ref = Mock()
+        mock_doc_ref.id = "player_1"
+        mock_doc_ref.parent.id = "players"
+        mock_doc_ref.get.return_value = mock_doc
+        self.mock_db.collection.return_value.document.return_value = mock_doc_ref
+
+        self.firestore_helper.get_player("player_1")
+        self.firestore_helper._commit_writes(
+            [("update", mock_doc_ref, {"age": 26})] * 501
+        )
+
+        assert self.mock_db.batch.call_count == 2
+        assert self.mock_db.batch.return_value.commit.call_count == 2
+
+        self.firestore_helper.get_player("player_1")
+        assert mock_doc_ref.get.call_count == 2
+
+    def test_failed_commit_raises_to_its_caller(self):
+        """Test a failed batch commit raises to the call that queued the writes"""
+        self.mock_db.batch.return_value.commit.side_effect = Exception("aborted")
+
+        matches = [
+            {
+                "homeClubId": "club_a",
+                "awayClubId": "club_b",
+                "result": {"winner": "home", "homeSets": 3, "awaySets": 1},
+            }
+        ]
+
+        with pytest.raises(Exception, match="aborted"):
+            self.firestore_helper.save_matches(matches)
 
     def test_get_league_standings(self):
         """Test getting league standings"""
@@ -185,3 +558,99 @@ class TestFirestoreHelper:
         self.mock_db.collection.assert_called_with("clubs")
         mock_collection.where.assert_called_with("countryId", "==", "testland")
         mock_first_where.where.assert_called_with("divisionTier", "==", 10)
+
+    def test_club_invalidation_evicts_only_its_league(self):
+        """Test a club write evicts its own league's standings and no other"""
+        helper = self.firestore_helper
+        helper._club_cache["club_1"] = {"countryId": "testland", "divisionTier": 3}
+        helper._standings_cache[("testland", 3)] = []
+        helper._standings_cache[("testland", 4)] = []
+
+        helper.invalidate("club", "club_1")
+
+        assert not helper.has_cached_standings("testland", 3)
+        assert helper.has_cached_standings("testland", 4)
+
+    def _aggregation_result(self, total, count):
+        total_result = Mock(alias="total", value=total)
+        count_result = Mock(alias="count", value=count)
+        return [[total_result, count_result]]
+
+    def test_get_similar_salary_stats(self):
+        """Test salaries are summed and counted by a Firestore aggregation"""
+        mock_club = Mock()
+        mock_club.id = "club_1"
+
+        mock_query = self.mock_db.collection.return_value.where.return_value.where
+        mock_query.return_value.stream.return_value = [mock_club]
+        aggregation = mock_query.return_value.sum.return_value.count.return_value
+        aggregation.get.return_value = self._aggregation_result(100000, 4)
+
+        average, count = self.firestore_helper.get_similar_salary_stats(
+            1, "OH", "testland"
+        )
+
+        assert (average, count) == (25000, 4)
+        mock_query.return_value.sum.assert_called_with("contract.salary", alias="total")
+        mock_query.return_value.stream.assert_called_once()
+
+    def test_get_similar_salary_stats_batches_clubs(self):
+        """Test club IDs are aggregated in "in" batches on the executor"""
+        helper = FirestoreHelper(self.mock_db, executor=ThreadPoolExecutor(4))
+
+        clubs = []
+        for i in range(45):
+            mock_club = Mock()
+            mock_club.id = f"club_{i}"
+            clubs.append(mock_club)
+
+        def players_query(field, op, value):
+            query = Mock()
+            aggregation = query.where.return_value.sum.return_value.count
+            aggregation.return_value.get.return_value = self._aggregation_result(
+                10000 * len(value), len(value)
+            )
+            return query
+
+        clubs_query = Mock()
+        clubs_query.where.return_value.where.return_value.stream.return_value = clubs
+        players_collection = Mock()
+        players_collection.where.side_effect = players_query
+        self.mock_db.collection.side_effect = lambda name: (
+            clubs_query if name == "clubs" else players_collection
+        )
+
+        average, count = helper.get_similar_salary_stats(1, "OH", "testland")
+
+        assert (average, count) == (10000, 45)
+        batches = [c.args[2] for c in players_collection.where.call_args_list]
+        assert [len(batch) for batch in batches] == [30, 15]
+
+    def test_get_similar_salary_stats_without_players(self):
+        """Test no comparable players yields a zero average"""
+        mock_query = self.mock_db.collection.return_value.where.return_value.where
+        mock_query.return_value.stream.return_value = []
+
+        assert self.firestore_helper.get_similar_salary_stats(1, "OH", "testland") == (
+            0,
+            0,
+        )
+
+    def test_similar_salary_stats_cached_until_player_write(self):
+        """Test a comparison group is aggregated once until a player changes"""
+        mock_club = Mock()
+        mock_club.id = "club_1"
+
+        mock_query = self.mock_db.collection.return_value.where.return_value.where
+        mock_query.return_value.stream.return_value = [mock_club]
+        aggregation = mock_query.return_value.sum.return_value.count.return_value
+        aggregation.get.return_value = self._aggregation_result(90000, 3)
+
+        helper = self.firestore_helper
+        assert helper.get_similar_salary_stats(1, "OH", "testland") == (30000, 3)
+        assert helper.get_similar_salary_stats(1, "OH", "testland") == (30000, 3)
+        assert aggregation.get.call_count == 1
+
+        helper.invalidate("player", "player_1")
+        helper.get_similar_salary_stats(1, "OH", "testland")
+        assert aggregation.get.call_count == 2
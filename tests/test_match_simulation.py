@@ -2,7 +2,7 @@
 Tests for match simulation engine
 """
 
-from game_engine.match_simulation import VolleyballSimulator, MatchEvent
+from game_engine.match_simulation import VolleyballSimulator, MatchEvent, Team
 from models.club import Club
 from models.player import (
     Player,
@@ -41,17 +41,17 @@ class TestVolleyballSimulator:
         self.home_players = self._create_test_players("home_club_1")
         self.away_players = self._create_test_players("away_club_1")
 
-        self.home_team = {
-            "id": "home_club_1",
-            "club": self.home_club.to_dict(),
-            "players": [p.to_dict() for p in self.home_players],
-        }
+        self.home_team = Team(
+            id="home_club_1",
+            club=self.home_club.to_dict(),
+            players=[p.to_dict() for p in self.home_players],
+        )
 
-        self.away_team = {
-            "id": "away_club_1",
-            "club": self.away_club.to_dict(),
-            "players": [p.to_dict() for p in self.away_players],
-        }
+        self.away_team = Team(
+            id="away_club_1",
+            club=self.away_club.to_dict(),
+            players=[p.to_dict() for p in self.away_players],
+        )
 
         self.tactics = {
             "home": {"formation": "5-1", "intensity": 1.0, "style": "balanced"},
@@ -215,7 +215,7 @@ class TestVolleyballSimulator:
 
         assert attendance > 0
 
-        stadium_capacity = self.home_team["club"]["facilities"]["stadiumCapacity"]
+        stadium_capacity = self.home_team.club["facilities"]["stadiumCapacity"]
         assert attendance <= stadium_capacity
 
     def test_revenue_calculation(self):
@@ -255,3 +255,29 @@ class TestVolleyballSimulator:
             for stat_value in team_stats.values():
                 assert stat_value >= 0
                 assert isinstance(stat_value, int)
+
+    def test_momentum_resets_between_matches(self):
+        """Test momentum left over from a previous match is not carried over"""
+        self.simulator.MOMENTUM_FACTOR = 1.0
+        original_simulate_set = self.simulator._simulate_set
+        momentum_at_first_set = []
+
+        def recording_simulate_set(*args, **kwargs):
+            if not momentum_at_first_set:
+                momentum_at_first_set.append(self.simulator.MOMENTUM_FACTOR)
+            return original_simulate_set(*args, **kwargs)
+
+        self.simulator._simulate_set = recording_simulate_set
+        self.simulator.simulate_match(self.home_team, self.away_team, self.tactics)
+
+        assert momentum_at_first_set == [0.0]
+
+    def test_fatigue_does_not_modify_rosters(self):
+        """Test fatigue is tracked per team without touching player documents"""
+        home_players_before = [dict(p) for p in self.home_team.players]
+
+        self.simulator.simulate_match(self.home_team, self.away_team, self.tactics)
+
+        assert self.home_team.players == home_players_before
+        assert self.simulator.fatigue["home"] > 0
+        assert self.simulator.fatigue["home"] == self.simulator.fatigue["away"]
@@ -325,6 +325,7 @@ class TestPlayerGeneration:
         assert player.club_id == "test_club"
         assert player.country_id == "testland"
         assert player.position == "OH"
+        assert player.division_tier == 10
         assert 18 <= player.age <= 35
         assert player.first_name is not None
         assert player.last_name is not None
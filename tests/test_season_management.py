@@ -0,0 +1,114 @@
+"""
+Tests for season creation and competition scheduling
+"""
+
+from unittest.mock import Mock
+from game_engine.season_management import SeasonManager
+from models.competition import CompetitionType
+
+
+class TestSeasonManager:
+    """Test cases for SeasonManager"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.firestore_helper = Mock()
+        self.firestore_helper.create_competition_object.return_value = True
+        self.season_manager = SeasonManager(self.firestore_helper)
+
+    def test_domestic_competitions_grouped_by_tier(self):
+        """Test a league is built per tier and the cup takes every club"""
+        clubs_by_tier = {
+            1: [
+                {"id": "club_1", "divisionTier": 1},
+                {"id": "club_2", "divisionTier": 1},
+            ],
+            2: [{"id": "club_3", "divisionTier": 2}],
+        }
+
+        competitions = self.season_manager._schedule_domestic_competitions(
+            "season_1", "volcania", clubs_by_tier
+        )
+
+        leagues = [c for c in competitions if c.type == CompetitionType.DOMESTIC_LEAGUE]
+        assert [league.division_tier for league in leagues] == [1, 2]
+        assert [len(league.participants) for league in leagues] == [2, 1]
+
+        [cup] = [c for c in competitions if c.type == CompetitionType.DOMESTIC_CUP]
+        assert [p.club_id for p in cup.participants] == ["club_1", "club_2", "club_3"]
+
+    def test_create_season_reads_each_country_once(self):
+        """Test domestic and continental competitions share one read per country"""
+        self.firestore_helper.get_clubs_by_country.side_effect = lambda country_id: [
+            {"id": f"{country_id}_elite", "divisionTier": 1},
+            {"id": f"{country_id}_pro", "divisionTier": 2},
+            {"id": f"{country_id}_amateur", "divisionTier": 10},
+        ]
+
+        result = self.season_manager.create_season(
+            "Test Season", 60, ["volcania", "coastalia"]
+        )
+
+        assert result.success
+        # Three leagues and a cup per country, plus three continental competitions
+        assert result.competitions_created == 11
+        assert self.firestore_helper.get_clubs_by_country.call_count == 2
+        self.firestore_helper.get_clubs_by_country_and_tier.assert_not_called()
+
+        created = [
+            call.args[0]
+            for call in self.firestore_helper.create_competition_object.call_args_list
+        ]
+        [champions] = [
+            c for c in created if c.type == CompetitionType.CONTINENTAL_CHAMPIONS
+        ]
+        assert [p.club_id for p in champions.participants] == [
+            "volcania_elite",
+            "coastalia_elite",
+        ]
+
+    def test_create_season_schedules_leagues_without_reading_competitions(self):
+        """Test fixtures come from the leagues just created, not a collection scan"""
+        self.firestore_helper.get_clubs_by_country.return_value = [
+            {"id": "club_1", "divisionTier": 1},
+            {"id": "club_2", "divisionTier": 1},
+            {"id": "club_without_tier"},
+        ]
+
+        result = self.season_manager.create_season("Test Season", 60, ["volcania"])
+
+        assert result.success
+        self.firestore_helper.get_all_competitions.assert_not_called()
+
+        [league] = [
+            call.args[0]
+            for call in self.firestore_helper.create_competition_object.call_args_list
+            if call.args[0].type == CompetitionType.DOMESTIC_LEAGUE
+        ]
+        [matches] = self.firestore_helper.save_scheduled_matches.call_args.args
+        assert len(matches) == 2
+        assert {m["homeClubId"] for m in matches} == {"club_1", "club_2"}
+        assert {m["competitionId"] for m in matches} == {league.id}
+        assert {m["seasonId"] for m in matches} == {result.season_id}
+
+    def test_league_schedule_is_double_round_robin_with_byes(self):
+        """Test an odd-sized league plays every fixture once each way"""
+        competition = {
+            "id": "league_1",
+            "participants": [{"clubId": f"club_{i}"} for i in range(5)],
+        }
+
+        self.season_manager._schedule_league_matches(competition, "season_1")
+
+        [matches] = self.firestore_helper.save_scheduled_matches.call_args.args
+        fixtures = [(m["homeClubId"], m["awayClubId"]) for m in matches]
+        assert len(fixtures) == len(set(fixtures)) == 5 * 4
+
+        for match_day in {m["matchDay"] for m in matches}:
+            playing = [
+                club_id
+                for m in matches
+                if m["matchDay"] == match_day
+                for club_id in (m["homeClubId"], m["awayClubId"])
+            ]
+            assert len(playing) == len(set(playing)) == 4
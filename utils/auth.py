@@ -3,12 +3,20 @@ Firebase Authentication utilities for Volleyball Manager API
 """
 
 from functools import wraps
+from typing import Any, Dict
+from cachetools import LRUCache  # type: ignore
 from flask import request, jsonify
 import firebase_admin
 from firebase_admin import auth, credentials
 import os
-import json
-import base64
+import threading
+import time
+
+# Verified tokens are reused until this many seconds before they expire
+TOKEN_EXPIRY_MARGIN_SECONDS = 5
+
+_token_cache: LRUCache = LRUCache(maxsize=4096)
+_token_cache_lock = threading.Lock()
 
 
 def initialize_firebase():
@@ -21,6 +29,26 @@ def initialize_firebase():
             raise ValueError(f"Failed to initialize Firebase: {str(e)}")
 
 
+def verify_token(token: str) -> Dict[str, Any]:
+    """
+    Verify a Firebase ID token, reusing an earlier verification of the same
+    token until shortly before it expires
+    """
+    with _token_cache_lock:
+        decoded_token = _token_cache.get(token)
+
+    if (
+        decoded_token is not None
+        and decoded_token.get("exp", 0) - TOKEN_EXPIRY_MARGIN_SECONDS > time.time()
+    ):
+        return decoded_token
+
+    decoded_token = auth.verify_id_token(token)
+    with _token_cache_lock:
+        _token_cache[token] = decoded_token
+    return decoded_token
+
+
 def require_auth(f):
     """
     Decorator to require Firebase Authentication for API endpoints
@@ -57,7 +85,7 @@ def require_auth(f):
             )
 
         try:
-            decoded_token = auth.verify_id_token(token)
+            decoded_token = verify_token(token)
             request.user_id = decoded_token["uid"]
             request.user_email = decoded_token.get("email")
             request.user_roles = decoded_token.get("roles", [])
@@ -2,36 +2,356 @@
 Firestore database helper functions
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, Iterator, Set, Tuple
+from concurrent.futures import Executor
+from functools import partial
+from dataclasses import dataclass
 from datetime import datetime
+from cachetools import LRUCache, TTLCache  # type: ignore
 from google.cloud import firestore  # type: ignore
 from models.club import Club
 from models.player import generate_random_player, Player
+from utils.constants import COUNTRIES
+import orjson
 import random
+import threading
 import uuid
+import zlib
+
+# Clubs and players change rarely, so short-lived copies are safe to serve
+CACHE_MAX_SIZE = 2048
+CACHE_TTL_SECONDS = 30
+
+# Standings only move when a match is saved, which evicts the affected league
+STANDINGS_CACHE_MAX_SIZE = 512
+STANDINGS_CACHE_TTL_SECONDS = 60
+
+# Salary comparisons are market-wide averages, so they may trail player
+# writes in other instances by a few minutes
+SALARY_STATS_CACHE_MAX_SIZE = 1024
+SALARY_STATS_CACHE_TTL_SECONDS = 300
+
+# Firestore rejects write batches with more than 500 operations
+MAX_BATCH_WRITES = 500
+
+# Upper bound on clubs kept live through snapshot listeners; the least
+# recently read club is unsubscribed once the limit is reached
+CLUB_WATCH_LIMIT = 1024
+
+# Firestore accepts at most 30 values in an "in" filter
+MAX_IN_FILTER_VALUES = 30
+
+# Match documents keep their rally events zlib-compressed in this field
+EVENT_LOG_FIELD = "eventLog"
+
+# Collections whose documents are cached, mapped to their cache kind
+CACHED_COLLECTIONS = {"clubs": "club", "players": "player"}
+
+
+@dataclass(slots=True)
+class ClubView:
+    """Read-only view of the club fields request handlers use"""
+
+    id: str
+    name: str
+    country_id: str
+    division_tier: int
+
+    @classmethod
+    def from_dict(cls, club_id: str, data: Dict[str, Any]) -> "ClubView":
+        return cls(
+            id=club_id,
+            name=data.get("name", "Unknown Club"),
+            country_id=data.get("countryId", ""),
+            division_tier=data.get("divisionTier", 10),
+        )
+
+
+def _pack_match_events(match_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of a match document with the per-set rally events moved into one
+    compressed bytes field, which is several times smaller than the events
+    stored as nested maps
+    """
+    result = match_data.get("result")
+    if not isinstance(result, dict):
+        return match_data
+    sets = result.get("sets")
+    if not sets or not any("events" in set_data for set_data in sets):
+        return match_data
+
+    events = [set_data.get("events", []) for set_data in sets]
+    packed = dict(match_data)
+    packed["result"] = {
+        **result,
+        "sets": [
+            {key: value for key, value in set_data.items() if key != "events"}
+            for set_data in sets
+        ],
+    }
+    packed[EVENT_LOG_FIELD] = zlib.compress(orjson.dumps(events))
+    return packed
+
+
+def _unpack_match_events(match_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Restore the per-set rally events of a stored match document in place"""
+    event_log = match_data.pop(EVENT_LOG_FIELD, None)
+    if event_log is not None:
+        events = orjson.loads(zlib.decompress(event_log))
+        for set_data, set_events in zip(match_data["result"]["sets"], events):
+            set_data["events"] = set_events
+    return match_data
+
+
+def _club_stat_deltas(
+    match_data: Dict[str, Any],
+) -> List[Tuple[str, Dict[str, int]]]:
+    """Per-club changes to the league stats produced by one match result"""
+    result = match_data["result"]
+    home_won = result["winner"] == "home"
+    deltas = []
+    for club_id, won, sets_won, sets_lost in (
+        (match_data["homeClubId"], home_won, result["homeSets"], result["awaySets"]),
+        (
+            match_data["awayClubId"],
+            not home_won,
+            result["awaySets"],
+            result["homeSets"],
+        ),
+    ):
+        deltas.append(
+            (
+                club_id,
+                {
+                    "wins": 1 if won else 0,
+                    "losses": 0 if won else 1,
+                    "points": 3 if won else 0,
+                    "setsWon": sets_won,
+                    "setsLost": sets_lost,
+                },
+            )
+        )
+    return deltas
+
+
+def _stat_increments(stats: Dict[str, int]) -> Dict[str, Any]:
+    """Turn stat deltas into Firestore increments on the club's stats map"""
+    return {
+        f"stats.{key}": firestore.Increment(value)
+        for key, value in stats.items()
+        if value
+    }
 
 
 class FirestoreHelper:
     """Helper class for Firestore operations"""
 
-    def __init__(self, db: firestore.Client):
+    def __init__(
+        self,
+        db: firestore.Client,
+        executor: Optional[Executor] = None,
+        watch_clubs: bool = False,
+    ):
         self.db = db
+        self._executor = executor
+        self._watch_clubs = watch_clubs
+        self._cache_lock = threading.Lock()
+        self._club_cache: TTLCache = TTLCache(CACHE_MAX_SIZE, CACHE_TTL_SECONDS)
+        self._player_cache: TTLCache = TTLCache(CACHE_MAX_SIZE, CACHE_TTL_SECONDS)
+        self._roster_cache: TTLCache = TTLCache(CACHE_MAX_SIZE, CACHE_TTL_SECONDS)
+        self._standings_cache: TTLCache = TTLCache(
+            STANDINGS_CACHE_MAX_SIZE, STANDINGS_CACHE_TTL_SECONDS
+        )
+        self._salary_stats_cache: TTLCache = TTLCache(
+            SALARY_STATS_CACHE_MAX_SIZE, SALARY_STATS_CACHE_TTL_SECONDS
+        )
+        self._live_clubs: Dict[str, Dict[str, Any]] = {}
+        self._club_watches: LRUCache = LRUCache(CLUB_WATCH_LIMIT)
+
+    def _cache_get(self, cache: TTLCache, key: Any) -> Optional[Any]:
+        with self._cache_lock:
+            return cache.get(key)
+
+    def _cache_set(self, cache: TTLCache, key: Any, value: Any):
+        with self._cache_lock:
+            cache[key] = value
+
+    def invalidate(self, kind: str, entity_id: str):
+        """Drop a cached club, player or roster so the next read hits Firestore"""
+        with self._cache_lock:
+            if kind == "club":
+                # A listener, if any, pushes the new document shortly
+                self._live_clubs.pop(entity_id, None)
+                club_data = self._club_cache.pop(entity_id, None)
+                if club_data is None:
+                    # League unknown, so any cached standings may include it
+                    self._standings_cache.clear()
+                else:
+                    self._standings_cache.pop(
+                        (club_data.get("countryId"), club_data.get("divisionTier")),
+                        None,
+                    )
+            elif kind == "player":
+                self._player_cache.pop(entity_id, None)
+                # The write may have moved the player between clubs
+                self._roster_cache.clear()
+                self._salary_stats_cache.clear()
+            elif kind == "roster":
+                # Rosters are cached per club and field projection
+                for key in [k for k in self._roster_cache if k[0] == entity_id]:
+                    self._roster_cache.pop(key, None)
+                self._salary_stats_cache.clear()
+            else:
+                raise ValueError(f"Unknown cache kind: {kind}")
+
+    def _cached_club(self, club_id: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the live or TTL-cached club document, if any"""
+        with self._cache_lock:
+            club_data = self._live_clubs.get(club_id)
+            if club_data is not None:
+                self._club_watches.get(club_id)  # mark as recently read
+            else:
+                club_data = self._club_cache.get(club_id)
+        return dict(club_data) if club_data is not None else None
+
+    def _watch_club(self, club_id: str, doc_ref: Any):
+        """Keep a club current through a snapshot listener once it is read"""
+        if not self._watch_clubs:
+            return
+        with self._cache_lock:
+            if club_id in self._club_watches:
+                return
+
+        watch = doc_ref.on_snapshot(partial(self._on_club_snapshot, club_id))
+
+        unsubscribe = []
+        with self._cache_lock:
+            if club_id in self._club_watches:
+                unsubscribe.append(watch)
+            else:
+                if len(self._club_watches) >= self._club_watches.maxsize:
+                    evicted_id, evicted_watch = self._club_watches.popitem()
+                    self._live_clubs.pop(evicted_id, None)
+                    unsubscribe.append(evicted_watch)
+                self._club_watches[club_id] = watch
+
+        # Unsubscribing joins the listener thread, so never hold the lock here
+        for stale_watch in unsubscribe:
+            stale_watch.unsubscribe()
+
+    def _on_club_snapshot(self, club_id: str, docs: List[Any], changes, read_time):
+        with self._cache_lock:
+            previous = self._live_clubs.pop(club_id, None)
+            if docs and docs[0].exists:
+                self._live_clubs[club_id] = docs[0].to_dict()
+
+            for club_data in (previous, self._live_clubs.get(club_id)):
+                if club_data is not None:
+                    self._standings_cache.pop(
+                        (club_data.get("countryId"), club_data.get("divisionTier")),
+                        None,
+                    )
+
+    def _commit_writes(self, writes: List[Tuple[str, Any, Dict[str, Any]]]):
+        """
+        Commit ("set" or "update", document, data) writes in batches
+
+        Each call builds its own batches of at most MAX_BATCH_WRITES, so a
+        failed commit only loses the caller's writes and raises to it. Cached
+        copies of the written clubs and players are dropped once committed.
+        """
+        for start in range(0, len(writes), MAX_BATCH_WRITES):
+            batch = self.db.batch()
+            invalidations: Set[Tuple[str, str]] = set()
+            for operation, doc_ref, data in writes[start : start + MAX_BATCH_WRITES]:
+                if operation == "set":
+                    batch.set(doc_ref, data)
+                else:
+                    batch.update(doc_ref, data)
+                kind = CACHED_COLLECTIONS.get(doc_ref.parent.id)
+                if kind:
+                    invalidations.add((kind, doc_ref.id))
+            batch.commit()
+            for kind, entity_id in invalidations:
+                self.invalidate(kind, entity_id)
 
     def get_club(self, club_id: str) -> Optional[Dict[str, Any]]:
         """Get club data from Firestore"""
+        cached = self._cached_club(club_id)
+        if cached is not None:
+            return cached
+
         try:
             doc_ref = self.db.collection("clubs").document(club_id)
             doc = doc_ref.get()
 
             if doc.exists:
-                return doc.to_dict()
+                club_data = doc.to_dict() or {}
+                self._cache_set(self._club_cache, club_id, club_data)
+                self._watch_club(club_id, doc_ref)
+                return dict(club_data)
             return None
         except Exception as e:
             print(f"Error getting club {club_id}: {e}")
             return None
 
+    def get_clubs_bulk(
+        self, club_ids: List[str], field_paths: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several clubs in a single batched read, keyed by club ID
+
+        When field_paths is given only those fields are fetched; such partial
+        documents are returned but never stored in the club cache.
+        """
+        clubs = {}
+        missing_ids = []
+        for club_id in club_ids:
+            cached = self._cached_club(club_id)
+            if cached is not None:
+                clubs[club_id] = cached
+            else:
+                missing_ids.append(club_id)
+
+        if not missing_ids:
+            return clubs
+
+        try:
+            refs = [self.db.collection("clubs").document(i) for i in missing_ids]
+
+            for doc in self.db.get_all(refs, field_paths=field_paths):
+                if doc.exists:
+                    club_data = doc.to_dict() or {}
+                    if field_paths is None:
+                        self._cache_set(self._club_cache, doc.id, club_data)
+                        self._watch_club(doc.id, doc.reference)
+                    clubs[doc.id] = dict(club_data)
+
+            return clubs
+        except Exception as e:
+            # Raised so callers answer with a service error, not "not found"
+            print(f"Error getting clubs {club_ids}: {e}")
+            raise
+
+    def get_club_view(self, club_id: str) -> Optional[ClubView]:
+        """Get a club as a ClubView, or None if it does not exist"""
+        club_data = self.get_club(club_id)
+        return ClubView.from_dict(club_id, club_data) if club_data else None
+
+    def get_club_views(self, club_ids: List[str]) -> Dict[str, ClubView]:
+        """Get several clubs as ClubViews in a single batched read"""
+        return {
+            club_id: ClubView.from_dict(club_id, club_data)
+            for club_id, club_data in self.get_clubs_bulk(club_ids).items()
+        }
+
     def create_club(self, club_data: Dict[str, Any]) -> str:
-        """Create a new club in Firestore"""
+        """
+        Create a new club in Firestore
+
+        The division tier the club was placed in is written back to
+        club_data["divisionTier"], so its squad can be generated for it.
+        """
         try:
             club_id = str(uuid.uuid4())
 
@@ -49,28 +369,90 @@ class FirestoreHelper:
 
             doc_ref = self.db.collection("clubs").document(club_id)
             doc_ref.set(club.to_dict())
+            self.invalidate("club", club_id)
+            club_data["divisionTier"] = club.division_tier
 
             return club_id
         except Exception as e:
             print(f"Error creating club: {e}")
             raise
 
+    def _cached_roster(self, key: Tuple) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of a TTL-cached roster, if any"""
+        roster = self._cache_get(self._roster_cache, key)
+        return [dict(p) for p in roster] if roster is not None else None
+
     def get_club_players(self, club_id: str) -> List[Dict[str, Any]]:
         """Get all players for a club"""
+        cached = self._cached_roster((club_id, None))
+        if cached is not None:
+            return cached
+
         try:
             players_ref = self.db.collection("players").where("clubId", "==", club_id)
             players = []
 
             for doc in players_ref.stream():
-                player_data = doc.to_dict()
+                player_data = doc.to_dict() or {}
                 player_data["id"] = doc.id
                 players.append(player_data)
 
-            return players
+            self._cache_set(self._roster_cache, (club_id, None), players)
+            return [dict(p) for p in players]
         except Exception as e:
             print(f"Error getting players for club {club_id}: {e}")
             return []
 
+    def get_players_for_clubs(
+        self, club_ids: List[str], field_paths: Optional[List[str]] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the rosters of several clubs with one "in" query per 30 clubs
+
+        When field_paths is given only those fields (plus clubId) are fetched,
+        and the projected rosters are cached separately from full ones.
+        """
+        club_ids = list(dict.fromkeys(club_ids))
+        fields_key = tuple(field_paths) if field_paths is not None else None
+        rosters: Dict[str, List[Dict[str, Any]]] = {}
+        missing_ids = []
+        for club_id in club_ids:
+            cached = self._cached_roster((club_id, fields_key))
+            if cached is not None:
+                rosters[club_id] = cached
+            else:
+                missing_ids.append(club_id)
+
+        if not missing_ids:
+            return rosters
+
+        try:
+            fetched: Dict[str, List[Dict[str, Any]]] = {i: [] for i in missing_ids}
+            queries = [
+                self.db.collection("players").where(
+                    "clubId", "in", missing_ids[i : i + MAX_IN_FILTER_VALUES]
+                )
+                for i in range(0, len(missing_ids), MAX_IN_FILTER_VALUES)
+            ]
+            if field_paths is not None:
+                select_fields = list(dict.fromkeys([*field_paths, "clubId"]))
+                queries = [query.select(select_fields) for query in queries]
+            for docs in self._map_queries(lambda query: list(query.stream()), queries):
+                for doc in docs:
+                    player_data = doc.to_dict() or {}
+                    player_data["id"] = doc.id
+                    fetched[player_data["clubId"]].append(player_data)
+
+            for club_id, players in fetched.items():
+                self._cache_set(self._roster_cache, (club_id, fields_key), players)
+                rosters[club_id] = [dict(p) for p in players]
+
+            return rosters
+        except Exception as e:
+            # Raised so callers answer with a service error, not an empty squad
+            print(f"Error getting players for clubs {club_ids}: {e}")
+            raise
+
     def generate_initial_squad(
         self, club_id: str, country_id: str, division_tier: int = 10
     ) -> List[str]:
@@ -92,6 +474,8 @@ class FirestoreHelper:
             ]
 
             player_ids = []
+            # The whole squad is far below the batch limit, so one commit
+            batch = self.db.batch()
 
             for position in positions:
                 player = generate_random_player(
@@ -99,23 +483,25 @@ class FirestoreHelper:
                 )
 
                 doc_ref = self.db.collection("players").document(player.id)
-                doc_ref.set(player.to_dict())
+                batch.set(doc_ref, player.to_dict())
 
                 player_ids.append(player.id)
 
+            batch.commit()
+            self.invalidate("roster", club_id)
             return player_ids
         except Exception as e:
             print(f"Error generating initial squad: {e}")
             raise
 
     def save_match(self, match_data: Dict[str, Any]) -> str:
-        """Save match result to Firestore"""
+        """Save match result to Firestore, under its "id" if it already has one"""
         try:
-            match_id = str(uuid.uuid4())
+            match_id = match_data.get("id") or str(uuid.uuid4())
             match_data["id"] = match_id
 
             doc_ref = self.db.collection("matches").document(match_id)
-            doc_ref.set(match_data)
+            doc_ref.set(_pack_match_events(match_data))
 
             self._update_club_stats_after_match(match_data)
 
@@ -124,58 +510,79 @@ class FirestoreHelper:
             print(f"Error saving match: {e}")
             raise
 
-    def _update_club_stats_after_match(self, match_data: Dict[str, Any]):
-        """Update club statistics after a match"""
-        try:
-            home_club_id = match_data["homeClubId"]
-            away_club_id = match_data["awayClubId"]
-            result = match_data["result"]
-
-            home_won = result["winner"] == "home"
-            home_sets = result["homeSets"]
-            away_sets = result["awaySets"]
-
-            home_doc_ref = self.db.collection("clubs").document(home_club_id)
-            home_doc = home_doc_ref.get()
-            if home_doc.exists:
-                home_data = home_doc.to_dict()
-                stats = home_data.get("stats", {})
-
-                if home_won:
-                    stats["wins"] = stats.get("wins", 0) + 1
-                    stats["points"] = stats.get("points", 0) + 3
-                else:
-                    stats["losses"] = stats.get("losses", 0) + 1
+    def save_matches(self, matches: List[Dict[str, Any]]) -> List[str]:
+        """
+        Save several match results using batched writes
 
-                stats["setsWon"] = stats.get("setsWon", 0) + home_sets
-                stats["setsLost"] = stats.get("setsLost", 0) + away_sets
-
-                home_doc_ref.update({"stats": stats})
+        Club stats are applied as increments, so each club gets a single
+        update per call however many of the matches it played in.
+        """
+        try:
+            match_ids = []
+            writes: List[Tuple[str, Any, Dict[str, Any]]] = []
+            club_stats: Dict[str, Dict[str, int]] = {}
+
+            for match_data in matches:
+                match_id = str(uuid.uuid4())
+                match_data["id"] = match_id
+                match_ids.append(match_id)
+                writes.append(
+                    (
+                        "set",
+                        self.db.collection("matches").document(match_id),
+                        _pack_match_events(match_data),
+                    )
+                )
 
-            away_doc_ref = self.db.collection("clubs").document(away_club_id)
-            away_doc = away_doc_ref.get()
-            if away_doc.exists:
-                away_data = away_doc.to_dict()
-                stats = away_data.get("stats", {})
+                for club_id, stats in _club_stat_deltas(match_data):
+                    totals = club_stats.setdefault(club_id, dict.fromkeys(stats, 0))
+                    for key, value in stats.items():
+                        totals[key] += value
+
+            for club_id, stats in club_stats.items():
+                writes.append(
+                    (
+                        "update",
+                        self.db.collection("clubs").document(club_id),
+                        _stat_increments(stats),
+                    )
+                )
 
-                if not home_won:
-                    stats["wins"] = stats.get("wins", 0) + 1
-                    stats["points"] = stats.get("points", 0) + 3
-                else:
-                    stats["losses"] = stats.get("losses", 0) + 1
+            self._commit_writes(writes)
 
-                stats["setsWon"] = stats.get("setsWon", 0) + away_sets
-                stats["setsLost"] = stats.get("setsLost", 0) + home_sets
+            return match_ids
+        except Exception as e:
+            print(f"Error saving matches: {e}")
+            raise
 
-                away_doc_ref.update({"stats": stats})
+    def _update_club_stats_after_match(self, match_data: Dict[str, Any]):
+        """Update club statistics after a match"""
+        # Increments need no prior read of the club documents
+        for club_id, stats in _club_stat_deltas(match_data):
+            try:
+                self.db.collection("clubs").document(club_id).update(
+                    _stat_increments(stats)
+                )
+                self.invalidate("club", club_id)
+            except Exception as e:
+                print(f"Error updating club stats for {club_id}: {e}")
 
-        except Exception as e:
-            print(f"Error updating club stats: {e}")
+    def has_cached_standings(self, country_id: str, division_tier: int) -> bool:
+        """Whether standings for this division would be served from the cache"""
+        return (
+            self._cache_get(self._standings_cache, (country_id, division_tier))
+            is not None
+        )
 
     def get_league_standings(
         self, country_id: str, division_tier: int
     ) -> List[Dict[str, Any]]:
         """Get league standings for a specific division"""
+        cache_key = (country_id, division_tier)
+        cached = self._cache_get(self._standings_cache, cache_key)
+        if cached is not None:
+            return [dict(row) for row in cached]
+
         try:
             clubs_ref = (
                 self.db.collection("clubs")
@@ -185,7 +592,7 @@ class FirestoreHelper:
             standings = []
 
             for doc in clubs_ref.stream():
-                club_data = doc.to_dict()
+                club_data = doc.to_dict() or {}
                 club_data["id"] = doc.id
 
                 stats = club_data.get("stats", {})
@@ -208,21 +615,27 @@ class FirestoreHelper:
             for i, club in enumerate(standings):
                 club["position"] = i + 1
 
-            return standings
+            self._cache_set(self._standings_cache, cache_key, standings)
+            return [dict(row) for row in standings]
         except Exception as e:
             print(f"Error getting league standings: {e}")
             return []
 
     def get_player(self, player_id: str) -> Optional[Dict[str, Any]]:
         """Get a single player by ID"""
+        cached = self._cache_get(self._player_cache, player_id)
+        if cached is not None:
+            return dict(cached)
+
         try:
             player_ref = self.db.collection("players").document(player_id)
             player_doc = player_ref.get()
 
             if player_doc.exists:
-                player_data = player_doc.to_dict()
+                player_data = player_doc.to_dict() or {}
                 player_data["id"] = player_doc.id
-                return player_data
+                self._cache_set(self._player_cache, player_id, player_data)
+                return dict(player_data)
             return None
         except Exception as e:
             print(f"Error getting player: {e}")
@@ -233,6 +646,7 @@ class FirestoreHelper:
         try:
             player_ref = self.db.collection("players").document(player_id)
             player_ref.update(player_data)
+            self.invalidate("player", player_id)
             return True
         except Exception as e:
             print(f"Error updating player: {e}")
@@ -244,51 +658,86 @@ class FirestoreHelper:
             player_data = player.to_dict()
             player_ref = self.db.collection("players").document()
             player_ref.set(player_data)
+            self.invalidate("player", player_ref.id)
             return player_ref.id
         except Exception as e:
             print(f"Error saving player: {e}")
             raise
 
-    def get_players_by_division_and_position(
+    def _map_queries(self, func: Callable[[Any], Any], queries: List[Any]) -> List:
+        """Apply func to each query, concurrently when an executor was provided"""
+        if self._executor is None:
+            return [func(query) for query in queries]
+        return list(self._executor.map(func, queries))
+
+    def _similar_club_ids(self, division_tier: int, country_id: str) -> List[str]:
+        """IDs of the clubs in the tiers used in salary comparison"""
+        tiers_to_check = [division_tier]
+        if division_tier > 1:
+            tiers_to_check.append(division_tier - 1)
+        if division_tier > 2:
+            tiers_to_check.append(division_tier - 2)
+
+        club_queries = [
+            self.db.collection("clubs")
+            .where("divisionTier", "==", tier)
+            .where("countryId", "==", country_id)
+            for tier in tiers_to_check
+        ]
+        clubs_per_tier = self._map_queries(
+            lambda query: list(query.stream()), club_queries
+        )
+        return [club.id for clubs in clubs_per_tier for club in clubs]
+
+    def _similar_player_queries(
         self, division_tier: int, position: str, country_id: str
-    ) -> List[Dict[str, Any]]:
-        """Get players by division tier and position for salary comparison"""
-        try:
-            players = []
-
-            tiers_to_check = [division_tier]
-            if division_tier > 1:
-                tiers_to_check.append(division_tier - 1)
-            if division_tier > 2:
-                tiers_to_check.append(division_tier - 2)
-
-            for tier in tiers_to_check:
-                clubs_ref = (
-                    self.db.collection("clubs")
-                    .where("divisionTier", "==", tier)
-                    .where("countryId", "==", country_id)
-                )
-                clubs = clubs_ref.stream()
-
-                club_ids = [club.id for club in clubs]
-
-                for club_id in club_ids:
-                    players_ref = (
-                        self.db.collection("players")
-                        .where("clubId", "==", club_id)
-                        .where("position", "==", position)
-                    )
-                    club_players = players_ref.stream()
-
-                    for player_doc in club_players:
-                        player_data = player_doc.to_dict()
-                        player_data["id"] = player_doc.id
-                        players.append(player_data)
+    ) -> List[Any]:
+        """Build player queries, 30 clubs each, for the salary comparison tiers"""
+        club_ids = self._similar_club_ids(division_tier, country_id)
+        return [
+            self.db.collection("players")
+            .where("clubId", "in", club_ids[i : i + MAX_IN_FILTER_VALUES])
+            .where("position", "==", position)
+            for i in range(0, len(club_ids), MAX_IN_FILTER_VALUES)
+        ]
+
+    def get_similar_salary_stats(
+        self, division_tier: int, position: str, country_id: str
+    ) -> Tuple[int, int]:
+        """
+        Average salary and number of comparable players
+
+        Firestore aggregates each batch of up to 30 clubs server-side, so no
+        player documents are transferred. Players without a salary count as 0.
+        Results are cached per comparison group until a player write.
+        """
+        cache_key = (division_tier, position, country_id)
+        cached = self._cache_get(self._salary_stats_cache, cache_key)
+        if cached is not None:
+            return cached
+
+        def salary_totals(players_ref: Any) -> Tuple[int, int]:
+            results = (
+                players_ref.sum("contract.salary", alias="total")
+                .count(alias="count")
+                .get()
+            )
+            totals = {result.alias: result.value for result in results[0]}
+            return int(totals["total"] or 0), int(totals["count"])
 
-            return players
+        try:
+            queries = self._similar_player_queries(division_tier, position, country_id)
+            totals = self._map_queries(salary_totals, queries)
+            total_salary = sum(total for total, _ in totals)
+            player_count = sum(count for _, count in totals)
+            average = total_salary // player_count if player_count else 0
+            self._cache_set(
+                self._salary_stats_cache, cache_key, (average, player_count)
+            )
+            return average, player_count
         except Exception as e:
-            print(f"Error getting players by division and position: {e}")
-            return []
+            print(f"Error getting similar player salaries: {e}")
+            return 0, 0
 
     def create_sample_data(self):
         """Create sample clubs and players for testing"""
@@ -327,8 +776,6 @@ class FirestoreHelper:
                 country_ref = self.db.collection("countries").document(country["id"])
                 country_ref.set(country)
 
-            from utils.constants import COUNTRIES
-
             for country_id, country_data in COUNTRIES.items():
                 country_doc = {
                     "id": country_id,
@@ -381,6 +828,22 @@ class FirestoreHelper:
             print(f"Error creating competition: {e}")
             return False
 
+    def get_clubs_by_country(self, country_id: str) -> List[Dict[str, Any]]:
+        """Get all clubs for a specific country, across every division tier"""
+        try:
+            query = self.db.collection("clubs").where("countryId", "==", country_id)
+
+            clubs = []
+            for doc in query.stream():
+                club_data = doc.to_dict()
+                club_data["id"] = doc.id
+                clubs.append(club_data)
+
+            return clubs
+        except Exception as e:
+            print(f"Error getting clubs by country: {e}")
+            return []
+
     def get_clubs_by_country_and_tier(
         self, country_id: str, tier: int
     ) -> List[Dict[str, Any]]:
@@ -406,36 +869,40 @@ class FirestoreHelper:
     def get_all_clubs(self) -> List[Dict[str, Any]]:
         """Get all clubs"""
         try:
-            clubs_ref = self.db.collection("clubs")
-            docs = clubs_ref.stream()
+            return list(self.iter_all_clubs())
+        except Exception:
+            return []
 
-            clubs = []
-            for doc in docs:
+    def iter_all_clubs(self) -> Iterator[Dict[str, Any]]:
+        """Yield all clubs as they arrive, raising if the stream fails"""
+        try:
+            for doc in self.db.collection("clubs").stream():
                 club_data = doc.to_dict()
                 club_data["id"] = doc.id
-                clubs.append(club_data)
-
-            return clubs
+                yield club_data
         except Exception as e:
+            # Raised so a streamed listing is aborted rather than cut short
             print(f"Error getting all clubs: {e}")
-            return []
+            raise
 
     def get_all_players(self) -> List[Dict[str, Any]]:
         """Get all players"""
         try:
-            players_ref = self.db.collection("players")
-            docs = players_ref.stream()
+            return list(self.iter_all_players())
+        except Exception:
+            return []
 
-            players = []
-            for doc in docs:
+    def iter_all_players(self) -> Iterator[Dict[str, Any]]:
+        """Yield all players as they arrive, raising if the stream fails"""
+        try:
+            for doc in self.db.collection("players").stream():
                 player_data = doc.to_dict()
                 player_data["id"] = doc.id
-                players.append(player_data)
-
-            return players
+                yield player_data
         except Exception as e:
+            # Raised so a streamed listing is aborted rather than cut short
             print(f"Error getting all players: {e}")
-            return []
+            raise
 
     def get_all_matches(self) -> List[Dict[str, Any]]:
         """Get all matches"""
@@ -445,9 +912,9 @@ class FirestoreHelper:
 
             matches = []
             for doc in docs:
-                match_data = doc.to_dict()
+                match_data = doc.to_dict() or {}
                 match_data["id"] = doc.id
-                matches.append(match_data)
+                matches.append(_unpack_match_events(match_data))
 
             return matches
         except Exception as e:
@@ -496,9 +963,9 @@ class FirestoreHelper:
 
             matches = []
             for doc in docs:
-                match_data = doc.to_dict()
+                match_data = doc.to_dict() or {}
                 match_data["id"] = doc.id
-                matches.append(match_data)
+                matches.append(_unpack_match_events(match_data))
 
             return matches
         except Exception as e:
@@ -515,9 +982,9 @@ class FirestoreHelper:
 
             matches = []
             for doc in docs:
-                match_data = doc.to_dict()
+                match_data = doc.to_dict() or {}
                 match_data["id"] = doc.id
-                matches.append(match_data)
+                matches.append(_unpack_match_events(match_data))
 
             return matches
         except Exception as e:
@@ -538,9 +1005,9 @@ class FirestoreHelper:
 
             matches = []
             for doc in docs:
-                match_data = doc.to_dict()
+                match_data = doc.to_dict() or {}
                 match_data["id"] = doc.id
-                matches.append(match_data)
+                matches.append(_unpack_match_events(match_data))
 
             return matches
         except Exception as e:
@@ -559,7 +1026,7 @@ class FirestoreHelper:
             }
 
             if result:
-                update_data["result"] = result
+                update_data.update(_pack_match_events({"result": result}))
 
             match_ref.update(update_data)
             return True
@@ -583,6 +1050,34 @@ class FirestoreHelper:
             print(f"Error saving scheduled match: {e}")
             raise
 
+    def save_scheduled_matches(self, matches: List[Dict[str, Any]]) -> List[str]:
+        """Save several scheduled matches using batched writes"""
+        try:
+            match_ids = []
+            writes: List[Tuple[str, Any, Dict[str, Any]]] = []
+            now = datetime.now().isoformat()
+
+            for match_data in matches:
+                match_id = str(uuid.uuid4())
+                match_data["id"] = match_id
+                match_data["createdAt"] = now
+                match_data["updatedAt"] = now
+                match_ids.append(match_id)
+                writes.append(
+                    (
+                        "set",
+                        self.db.collection("matches").document(match_id),
+                        match_data,
+                    )
+                )
+
+            self._commit_writes(writes)
+
+            return match_ids
+        except Exception as e:
+            print(f"Error saving scheduled matches: {e}")
+            raise
+
     def create_competition(self, competition_data: Dict[str, Any]) -> bool:
         """Create a new competition"""
         try: